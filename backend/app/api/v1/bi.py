@@ -5,6 +5,7 @@ import numpy as np
 import json
 from pydantic import BaseModel
 
+from app.api.v1.responses import model_response
 from app.config import settings
 from app.services.bi.orchestrator import BIOrchestrator, BIResponse
 from app.services.bi.llm_client import call_llm_api
@@ -726,7 +727,7 @@ async def get_ai_recommendations(
         
         recommendations = generate_ai_recommendations(domain, phase_results)
         
-        return recommendations.dict()
+        return recommendations.model_dump()
         
     except Exception as e:
         print(f"Error generating AI recommendations: {e}")
@@ -757,7 +758,7 @@ async def create_kpi_proposals(request: KPIProposalRequest):
         raise HTTPException(status_code=400, detail="count must be between 1 and 5.")
     try:
         bundle = generate_kpi_proposals(domain=request.domain, language=request.language, count=request.count)
-        return bundle
+        return model_response(bundle)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
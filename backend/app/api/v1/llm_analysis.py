@@ -3,6 +3,7 @@ from typing import List
 import json
 from datetime import datetime
 
+from app.api.v1.responses import model_response
 from app.services.phase14_5_llm_analysis import LLMAnalysisService
 from app.services.llm.client import LLMConfigurationError, get_llm_client
 from app.services.llm.prompts import SYSTEM_PROMPT, CHAT_PROMPT_TEMPLATE
@@ -22,7 +23,7 @@ async def run_llm_analysis():
 
         service = LLMAnalysisService()
         result = service.run()
-        return result
+        return model_response(result)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -97,7 +98,7 @@ async def log_decision(
             made_by="human",
             rationale=rationale,
         )
-        log_data.append(new_entry.dict())
+        log_data.append(new_entry.model_dump())
 
         with open(log_path, "w", encoding="utf-8") as f:
             json.dump(log_data, f, indent=2, ensure_ascii=False)
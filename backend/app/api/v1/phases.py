@@ -2,14 +2,35 @@
 Phase-specific API endpoints
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional
+import asyncio
+import csv
+import functools
+import os
+import re
+import shutil
+import tempfile
+from types import SimpleNamespace
+import anyio
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 import io
 
+from .responses import model_response
 from ...utils.csv_cleaner import CSVCleaner
+from ...utils.csv_io import read_csv_arrow
+from ...utils.excel_io import read_excel
+from ...utils.frame_info import dtype_names
+from ...utils.parquet_io import (
+    PARQUET_WRITE_KWARGS, parquet_columns, parquet_distinct_counts, parquet_num_rows,
+    read_parquet_async, read_parquet_cached_async, read_parquet_head_async,
+)
 from ...models.schemas import (
     DomainSelection, GoalDefinition, KPIDefinition, 
     Phase1Response, DomainInfo, DomainType,
@@ -21,7 +42,7 @@ from ...services.phase1_goal_kpis import Phase1Service, GoalKPIsService, GoalKPI
 from ...services.phase2_ingestion import Phase2IngestionService, IngestionService, IngestionResult
 from ...services.phase3_schema import Phase3SchemaService, SchemaService, SchemaResult
 from ...services.phase0_quality_control import QualityControlService, QualityControlResult
-from ...services.domain_packs import DOMAIN_PACKS
+from ...services.domain_packs import DOMAIN_PACKS, DOMAIN_DTYPES
 from ...config import settings
 from ...services.phase4_profiling import ProfilingService, ProfilingResult
 from ...services.phase5_missing_data import MissingDataService, ImputationResult
@@ -31,7 +52,12 @@ from ...services.phase7_5_encoding import EncodingScalingService, EncodingScalin
 import json
 from fastapi import Form
 from ...services.phase8_merging import MergingService, MergingResult
-from ...services.phase9_correlations import CorrelationsService, CorrelationsResult
+from ...services.phase9_correlations import (
+    CorrelationsService,
+    CorrelationsResult,
+    read_correlation_pairs,
+    write_correlation_pairs,
+)
 from ...services.phase9_5_business_validation import BusinessValidationService, BusinessValidationResult
 from ...services.phase10_packaging import PackagingService, PackagingResult
 from ...services.phase10_5_split import SplitService, SplitResult
@@ -39,39 +65,177 @@ from ...services.phase11_advanced import AdvancedExplorationService, AdvancedExp
 from ...services.phase11_5_selection import FeatureSelectionService, SelectionResult
 from ...services.phase13_monitoring import MonitoringService, MonitoringResult
 from ...services.text_dataset_registry import TextDatasetRegistry
+from ...services.phase12.detection import is_text_arrow_type
 from ...services.phase12.orchestrator import Phase12Orchestrator, Phase12Result
 from ...services.llm.analyzers import TargetSuggester
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# DOMAIN_PACKS is static, so its response body is encoded once per process
+_DOMAIN_PACKS_JSON = orjson.dumps(
+    {"domain_packs": {name: pack.model_dump() for name, pack in DOMAIN_PACKS.items()}}
+)
 
 # Dependency functions
+# The services hold no per-request state, so one instance per process is
+# shared instead of re-loading domain info and re-creating directories
+@functools.lru_cache(maxsize=1)
 def get_phase1_service() -> Phase1Service:
     return Phase1Service()
 
+@functools.lru_cache(maxsize=1)
 def get_phase2_service() -> Phase2IngestionService:
     return Phase2IngestionService()
 
+@functools.lru_cache(maxsize=1)
 def get_phase3_service() -> Phase3SchemaService:
     return Phase3SchemaService()
 
 
+# Uploads are copied to disk in bounded chunks rather than parsed from the
+# request's spooled file, so memory per upload does not grow with file size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Concurrent Phase 2/3 runs are capped so a burst of large uploads queues
+# instead of oversubscribing CPU and disk; domain checks are not limited
+INGEST_CONCURRENCY = max(2, (os.cpu_count() or 1) // 2)
+_INGEST_SEM = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+
+# Leading bytes of binary formats; these win over the client-supplied name so
+# mislabelled or extension-less uploads still reach the right parser
+_UPLOAD_SIGNATURES = {
+    b"PK\x03\x04": ".xlsx",
+    b"\xd0\xcf\x11\xe0": ".xls",
+    b"PAR1": ".parquet",
+}
+
+# Parsers for upload file objects, keyed by normalised suffix
+_UPLOAD_READERS = {
+    ".csv": pd.read_csv,
+    ".xlsx": read_excel,
+    ".xls": read_excel,
+    ".parquet": pd.read_parquet,
+}
+
+
+async def _upload_suffix(file: UploadFile) -> str:
+    """Lower-cased upload extension, corrected by sniffing the first bytes"""
+    head = await file.read(4)
+    await file.seek(0)
+    return _UPLOAD_SIGNATURES.get(head, Path(file.filename or "").suffix.lower())
+
+
+def _check_upload_size(file: UploadFile) -> None:
+    """Reject an upload whose declared size exceeds ``settings.max_file_size_mb``"""
+    if file.size is not None and file.size > settings.max_file_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds the {settings.max_file_size_mb} MB upload limit"
+        )
+
+
+def _spool_dir(needed_bytes: int) -> Optional[str]:
+    """``settings.upload_tmp_dir`` if it can hold the upload, else None (system temp dir)"""
+    try:
+        if shutil.disk_usage(settings.upload_tmp_dir).free > needed_bytes:
+            return str(settings.upload_tmp_dir)
+    except OSError:
+        pass
+    return None
+
+
+async def _spool_upload(file: UploadFile, suffix: str) -> Path:
+    """Stream an upload into a named temp file, keeping its extension"""
+    max_bytes = settings.max_file_size_mb * 1024 * 1024
+    spool_dir = _spool_dir(file.size if file.size is not None else max_bytes)
+    fd, name = tempfile.mkstemp(suffix=suffix, dir=spool_dir)
+    os.close(fd)
+    path = Path(name)
+    try:
+        written = 0
+        async with await anyio.open_file(path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                # Uploads without a declared size are capped while streaming
+                written += len(chunk)
+                if written > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds the {settings.max_file_size_mb} MB upload limit"
+                    )
+                await out.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _read_upload(path: Path, header_only: bool = False, usecols=None) -> pd.DataFrame:
+    """Parse a spooled CSV or Excel upload, or just its header row"""
+    if path.suffix == ".csv":
+        if header_only:
+            # The pyarrow engine does not support nrows
+            return pd.read_csv(path, nrows=0)
+        # Multi-threaded Arrow parser; the frame stays Arrow-backed because
+        # callers only look at its shape and column names
+        return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow", usecols=usecols)
+    if header_only:
+        return read_excel(path, nrows=0)
+    return read_excel(path, usecols=usecols)
+
+
+# Parsed JSON artifacts by path, reused while the file's mtime and size match
+_JSON_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON artifact, re-reading it only after it changes; do not mutate the result"""
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != version:
+        cached = (version, orjson.loads(path.read_bytes()))
+        _JSON_CACHE[path] = cached
+    return cached[1]
+
+
+async def _write_parquet_files(frames: dict[Path, pd.DataFrame]) -> None:
+    """Write independent artifacts concurrently, one worker thread per file"""
+    await asyncio.gather(*(
+        asyncio.to_thread(df.to_parquet, path, **PARQUET_WRITE_KWARGS)
+        for path, df in frames.items()
+    ))
+
+
+# The domain catalog is loaded once by the cached Phase 1 service and never
+# changes afterwards, so its response bodies are encoded on first use only
+@functools.lru_cache(maxsize=1)
+def _domains_json() -> bytes:
+    service = get_phase1_service()
+    return orjson.dumps([info.model_dump(mode="json") for info in service.get_available_domains()])
+
+
+@functools.lru_cache(maxsize=None)
+def _domain_info_json(domain: DomainType) -> Optional[bytes]:
+    domain_info = get_phase1_service().get_domain_info(domain)
+    return orjson.dumps(domain_info.model_dump(mode="json")) if domain_info else None
+
+
 @router.get("/domains", response_model=List[DomainInfo])
 async def get_available_domains():
     """Get list of available business domains"""
-    service = get_phase1_service()
-    return service.get_available_domains()
+    return Response(_domains_json(), media_type="application/json")
 
 
 @router.get("/domains/{domain}", response_model=DomainInfo)
 async def get_domain_info(domain: DomainType):
     """Get detailed information about a specific domain"""
-    service = get_phase1_service()
-    domain_info = service.get_domain_info(domain)
+    domain_info_json = _domain_info_json(domain)
     
-    if not domain_info:
+    if not domain_info_json:
         raise HTTPException(status_code=404, detail=f"Domain '{domain}' not found")
     
-    return domain_info
+    return Response(domain_info_json, media_type="application/json")
 
 
 @router.post("/domain-selection", response_model=Phase1Response)
@@ -121,26 +285,29 @@ async def run_quality_control(
     - file: CSV or Excel file
     - key_columns: Optional comma-separated key columns (e.g., "order_id,customer_id")
     """
+    _check_upload_size(file)
     try:
+        suffix = await _upload_suffix(file)
         # Advanced file reading with Mind-Q V3 CSV recovery
-        if file.filename.endswith('.csv'):
+        if suffix == '.csv':
+            buffer = io.BytesIO(await file.read())
             try:
-                # Try normal parsing first
-                df = pd.read_csv(file.file)
-            except pd.errors.ParserError as e:
+                # Try normal parsing first, on Arrow's multi-threaded reader
+                df = await asyncio.to_thread(read_csv_arrow, buffer)
+            except (pa.ArrowInvalid, pd.errors.ParserError) as e:
                 print(f"CSV parsing failed, applying Mind-Q recovery...")
-                file.file.seek(0)
+                buffer.seek(0)
                 
                 # Mind-Q V3 CSV Recovery Strategies (based on common issues)
                 recovery_attempts = [
                     # Strategy 1: Skip problematic lines
-                    lambda: pd.read_csv(file.file, on_bad_lines='skip', engine='python'),
+                    lambda: pd.read_csv(buffer, on_bad_lines='skip', engine='python'),
                     # Strategy 2: Handle quote issues
-                    lambda: pd.read_csv(file.file, quoting=1, on_bad_lines='skip', engine='python'),
+                    lambda: pd.read_csv(buffer, quoting=1, on_bad_lines='skip', engine='python'),
                     # Strategy 3: Different separator handling
-                    lambda: pd.read_csv(file.file, sep=',', skipinitialspace=True, on_bad_lines='skip'),
+                    lambda: pd.read_csv(buffer, sep=',', skipinitialspace=True, on_bad_lines='skip'),
                     # Strategy 4: Manual delimiter detection
-                    lambda: pd.read_csv(file.file, sep=None, engine='python', on_bad_lines='skip')
+                    lambda: pd.read_csv(buffer, sep=None, engine='python', on_bad_lines='skip')
                 ]
                 
                 df = None
@@ -148,8 +315,8 @@ async def run_quality_control(
                 
                 for i, strategy in enumerate(recovery_attempts):
                     try:
-                        file.file.seek(0)
-                        df = strategy()
+                        buffer.seek(0)
+                        df = await asyncio.to_thread(strategy)
                         if len(df) > 0:
                             strategy_used = f"Mind-Q Recovery Strategy {i+1}"
                             break
@@ -165,8 +332,8 @@ async def run_quality_control(
                 print(f"Mind-Q CSV Recovery Success: {strategy_used}")
                 print(f"Recovered {len(df)} rows from malformed CSV")
                 
-        elif file.filename.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file.file)
+        elif suffix in ('.xlsx', '.xls'):
+            df = await asyncio.to_thread(read_excel, file.file)
         else:
             raise HTTPException(status_code=400, detail="Only CSV and Excel files supported")
         
@@ -175,7 +342,7 @@ async def run_quality_control(
         
         # Run quality control with enhanced reporting
         service = QualityControlService(df=df, key_columns=keys)
-        result = service.run()
+        result = await asyncio.to_thread(service.run)
         
         return result
     
@@ -183,6 +350,75 @@ async def run_quality_control(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Substrings that mark a likely target column per domain, and substrings
+# that rule a column out; each list is compiled into one alternation
+_TARGET_KEYWORDS = {
+    "logistics": ["status", "deliver", "delivered", "return", "rto", "on_time", "on hold", "origin", "awb", "warehouse"],
+    "e-commerce": ["purchase", "refund", "churn", "fraud", "cart", "order", "customer", "campaign"],
+    "healthcare": ["readmission", "adverse", "no_show", "noshow", "showed", "show_up", "appointment", "patient", "hipertension", "diabetes", "gender", "neighbourhood"],
+    "retail": ["conversion", "coupon", "return", "upsell", "inventory", "store", "sku"],
+    "finance": ["default", "fraud", "late_payment", "closure", "loan", "credit", "balance"],
+}
+_TARGET_KEYWORD_PATTERNS = {
+    domain: re.compile("|".join(map(re.escape, keywords)))
+    for domain, keywords in _TARGET_KEYWORDS.items()
+}
+_BANNED_TARGET_PATTERN = re.compile("|".join(map(re.escape, ["missing", "id", "phone", "address", "name", "ref"])))
+
+
+def _pandas_nunique(df: pd.DataFrame) -> dict:
+    try:
+        return df.nunique(dropna=True).to_dict()
+    except TypeError:
+        # Unhashable values (lists, dicts) in some column; count the others one by one
+        nuniques = {}
+        for col in df.columns:
+            try:
+                nuniques[col] = df[col].nunique(dropna=True)
+            except TypeError:
+                continue
+        return nuniques
+
+
+def _sample_nunique(df: pd.DataFrame) -> dict:
+    """
+    ``df.nunique(dropna=True)`` as a dict, counted by Arrow in one grouped
+    ``count_distinct`` over all columns. Columns Arrow has no kernel for are
+    counted by pandas; columns pandas cannot hash either are left out.
+    """
+    if not df.columns.is_unique or not all(isinstance(col, str) for col in df.columns):
+        return _pandas_nunique(df)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return _pandas_nunique(df)
+
+    nuniques = {}
+    countable, others = [], []
+    for field, values in zip(table.schema, table.columns):
+        if pa.types.is_dictionary(field.type):
+            values = values.cast(field.type.value_type)
+        if pa.types.is_null(values.type):
+            nuniques[field.name] = 0
+        elif pa.types.is_nested(values.type):
+            others.append(field.name)
+        else:
+            countable.append((field.name, values))
+
+    if countable:
+        try:
+            counts = pa.TableGroupBy(
+                pa.table(dict(countable)), []
+            ).aggregate([(name, "count_distinct") for name, _ in countable])
+        except pa.ArrowNotImplementedError:
+            return _pandas_nunique(df)
+        for name, _ in countable:
+            nuniques[name] = counts.column(f"{name}_count_distinct")[0].as_py()
+    if others:
+        nuniques.update(_pandas_nunique(df[others]))
+    return nuniques
+
+
 @router.get("/columns")
 async def list_available_columns(domain: str = "general"):
     """Return candidate columns from the latest merged or standardized data with simple stats.
@@ -190,32 +426,22 @@ async def list_available_columns(domain: str = "general"):
     This helps the frontend suggest a target column for advanced phases.
     """
     try:
-        import pandas as pd
         # Prefer merged data as the most comprehensive
         artifacts = settings.artifacts_dir
         feature_dict = {}
         dict_path = artifacts / "feature_dictionary.json"
         if dict_path.exists():
             try:
-                with open(dict_path, "r", encoding="utf-8") as f:
-                    entries = json.load(f)
+                entries = _load_json(dict_path)
                 feature_dict = {entry["name"]: entry for entry in entries}
             except Exception:
                 feature_dict = {}
-        domain_keywords = {
-            "logistics": ["status", "deliver", "delivered", "return", "rto", "on_time", "on hold", "origin", "awb", "warehouse"],
-            "e-commerce": ["purchase", "refund", "churn", "fraud", "cart", "order", "customer", "campaign"],
-            "healthcare": ["readmission", "adverse", "no_show", "noshow", "showed", "show_up", "appointment", "patient", "hipertension", "diabetes", "gender", "neighbourhood"],
-            "retail": ["conversion", "coupon", "return", "upsell", "inventory", "store", "sku"],
-            "finance": ["default", "fraud", "late_payment", "closure", "loan", "credit", "balance"],
-        }
-        keywords = domain_keywords.get(domain, domain_keywords["logistics"])
+        keyword_pattern = _TARGET_KEYWORD_PATTERNS.get(domain, _TARGET_KEYWORD_PATTERNS["logistics"])
 
         def keyword_score(columns: list[str]) -> int:
-            lowered = [col.lower() for col in columns]
-            return sum(1 for col in lowered if any(k in col for k in keywords))
+            return sum(1 for col in columns if keyword_pattern.search(col.lower()))
 
-        candidate_datasets: list[tuple[int, int, float, Path, "pd.DataFrame"]] = []
+        candidate_datasets: list[tuple[int, int, float, Path]] = []
         staged_files = [
             ("merged_data.parquet", 9),        # Phase 8/9 output
             ("standardized_data.parquet", 6),  # Phase 6 output
@@ -232,37 +458,40 @@ async def list_available_columns(domain: str = "general"):
             path = artifacts / filename
             if not path.exists():
                 continue
+            # Scoring only needs column names, which the Parquet footer holds
             try:
-                df_candidate = pd.read_parquet(path)
+                candidate_columns = parquet_columns(path)
             except Exception:
                 continue
             try:
                 mtime = path.stat().st_mtime
             except OSError:
                 mtime = 0.0
-            score = keyword_score(df_candidate.columns.tolist())
-            candidate_datasets.append((score, stage, mtime, path, df_candidate))
+            score = keyword_score(candidate_columns)
+            candidate_datasets.append((score, stage, mtime, path))
 
         if not candidate_datasets:
             raise HTTPException(404, "No dataset available to infer columns. Run earlier phases first.")
 
         # Choose dataset with best keyword match, then by stage, then recency
         candidate_datasets.sort(key=lambda item: (item[0], item[1], item[2]), reverse=True)
-        _, _, _, selected_path, df = candidate_datasets[0]
+        _, _, _, selected_path = candidate_datasets[0]
+        # Only the preview rows are decoded, not the whole artifact
+        df_sample = await read_parquet_head_async(selected_path, 10000)
 
-        preview_rows = min(len(df), 10000)
-        df_sample = df.head(preview_rows)
+        dtypes = dtype_names(df_sample)
+        nuniques = _sample_nunique(df_sample)
 
         cols = []
         for col in df_sample.columns:
+            if col not in nuniques:
+                continue
             try:
-                nunique = int(df_sample[col].nunique(dropna=True))
-                dtype = str(df_sample[col].dtype)
                 meta = feature_dict.get(col, {})
                 cols.append({
                     "name": col,
-                    "dtype": dtype,
-                    "nunique": nunique,
+                    "dtype": dtypes[col],
+                    "nunique": int(nuniques[col]),
                     "alias": meta.get("clean_name"),
                     "recommended_role": meta.get("recommended_role"),
                     "description": meta.get("description"),
@@ -285,12 +514,15 @@ async def list_available_columns(domain: str = "general"):
 
         # Heuristic candidates and suggestion (domain-aware)
         def bad_name(name: str) -> bool:
-            lname = name.lower()
-            banned = ["missing", "id", "phone", "address", "name", "ref"]
-            return any(b in lname for b in banned)
+            return _BANNED_TARGET_PATTERN.search(name.lower()) is not None
 
-        binary_cols = [c for c in cols if c["nunique"] == 2 and not bad_name(c["name"])]
-        keyword_binary = [c for c in binary_cols if any(k in c["name"].lower() for k in keywords)]
+        # Masks over the whole column catalog in one vectorised pass each
+        names = pd.Series([c["name"] for c in cols], dtype=object).str.lower()
+        binary_mask = pd.Series([c["nunique"] for c in cols], dtype="int64").eq(2)
+        binary_mask &= ~names.str.contains(_BANNED_TARGET_PATTERN)
+        keyword_mask = binary_mask & names.str.contains(keyword_pattern)
+        binary_cols = [c for c, keep in zip(cols, binary_mask) if keep]
+        keyword_binary = [c for c, keep in zip(cols, keyword_mask) if keep]
 
         heuristic_candidates = keyword_binary or binary_cols
         heuristic_list = [
@@ -346,7 +578,7 @@ async def get_phase1_status():
 @router.get("/domain-packs")
 async def get_domain_packs():
     """Get available domain packs with KPIs and expected columns"""
-    return {"domain_packs": DOMAIN_PACKS}
+    return Response(_DOMAIN_PACKS_JSON, media_type="application/json")
 
 
 @router.post("/domain-compatibility", response_model=Phase1DomainCompatibilityResponse)
@@ -359,15 +591,14 @@ async def check_domain_compatibility(
     return service.check_domain_compatibility(domain, columns)
 
 
-@router.post("/goal-kpis")
+@router.post("/goal-kpis", response_model=GoalKPIsResult)
 async def run_goal_kpis(
     columns: List[str],
     domain: Optional[str] = None
 ):
     """Execute Phase 1: Goal & KPIs with domain compatibility"""
     service = GoalKPIsService(columns=columns, domain=domain)
-    result = service.run()
-    return result.dict()
+    return await asyncio.to_thread(service.run)
 
 
 # ===== PHASE 2 ENDPOINTS =====
@@ -379,7 +610,8 @@ async def ingest_data(
 ):
     """Ingest data from source file to Parquet format"""
     service = get_phase2_service()
-    return service.ingest_data(source_file, config)
+    async with _INGEST_SEM:
+        return await asyncio.to_thread(service.ingest_data, source_file, config)
 
 
 @router.post("/ingest-simple")
@@ -388,9 +620,6 @@ async def ingest_data_simple(
     artifacts_dir: Optional[str] = None
 ):
     """Simple ingestion service - Phase 2: Ingestion & Landing"""
-    from pathlib import Path
-    from ...config import settings
-    
     # Use provided artifacts_dir or default
     if artifacts_dir:
         artifacts_path = Path(artifacts_dir)
@@ -399,15 +628,15 @@ async def ingest_data_simple(
     
     # Create service and run ingestion
     service = IngestionService(file_path=Path(file_path), artifacts_dir=artifacts_path)
-    df, result = service.run()
+    df, result = await asyncio.to_thread(service.run)
     
     return {
         "dataframe_info": {
             "shape": df.shape,
             "columns": df.columns.tolist(),
-            "dtypes": df.dtypes.to_dict()
+            "dtypes": dtype_names(df)
         },
-        "ingestion_result": result.dict()
+        "ingestion_result": result
     }
 
 
@@ -442,28 +671,27 @@ async def schema_simple(
     file: UploadFile = File(...)
 ):
     """Simple schema service - Phase 3: Schema & Dtypes"""
+    _check_upload_size(file)
     try:
         # Read file
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(file.file)
-        elif file.filename.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file.file)
-        else:
+        suffix = await _upload_suffix(file)
+        if suffix not in ('.csv', '.xlsx', '.xls'):
             raise HTTPException(status_code=400, detail="Only CSV and Excel files supported")
+        df = await asyncio.to_thread(_UPLOAD_READERS[suffix], file.file)
         
         # Run schema service
         service = SchemaService(df=df)
-        df_typed, result = service.run()
+        df_typed, result = await asyncio.to_thread(service.run)
         
         return {
             "file_info": {
                 "filename": file.filename,
                 "original_shape": df.shape,
                 "typed_shape": df_typed.shape,
-                "original_dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-                "typed_dtypes": {col: str(dtype) for col, dtype in df_typed.dtypes.items()}
+                "original_dtypes": dtype_names(df),
+                "typed_dtypes": dtype_names(df_typed)
             },
-            "schema_result": result.dict()
+            "schema_result": result
         }
     
     except Exception as e:
@@ -493,17 +721,22 @@ async def run_phase14(
         merged_path = artifacts / "merged_data.parquet"
         encoded_path = artifacts / "encoded_data.parquet"
 
-        import pandas as pd
-        df_source = None
         if train_path.exists():
-            df_source = pd.read_parquet(train_path)
+            source_path = train_path
         elif merged_path.exists():
-            df_source = pd.read_parquet(merged_path)
+            source_path = merged_path
         elif encoded_path.exists():
-            df_source = pd.read_parquet(encoded_path)
+            source_path = encoded_path
         else:
             raise HTTPException(400, "No dataset found to derive artifacts. Run previous phases first.")
 
+        # Column names come from the footer; the target heuristic counts
+        # distinct values one projected column at a time, cached per file version
+        source_columns = parquet_columns(source_path)
+
+        async def distinct_counts(name: str) -> tuple[int, int]:
+            return await asyncio.to_thread(parquet_distinct_counts, source_path, name)
+
         provided_target = bool(target_column)
 
         def _looks_like_id(name: str) -> bool:
@@ -511,39 +744,39 @@ async def run_phase14(
             return any(keyword in lname for keyword in ["id", "uuid", "reference", "phone", "address", "name"])
 
         if provided_target:
-            if target_column not in df_source.columns:
+            if target_column not in source_columns:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Target column '{target_column}' not found in dataset. Select a valid column before running Phase 14.",
                 )
             target_column = str(target_column)
         else:
-            # Heuristic: prefer binary outcomes that are not identifier-like
-            binary_candidates = [
-                col for col in df_source.columns
-                if df_source[col].dropna().nunique() == 2 and not _looks_like_id(str(col))
-            ]
-            if binary_candidates:
-                target_column = str(binary_candidates[0])
-            else:
+            # Heuristic: prefer the first binary outcome that is not identifier-like
+            target_column = None
+            for col in source_columns:
+                if _looks_like_id(str(col)):
+                    continue
+                if (await distinct_counts(col))[0] == 2:
+                    target_column = str(col)
+                    break
+            if target_column is None:
                 # Fallback to the last column
-                target_column = str(df_source.columns[-1])
-            if df_source[target_column].nunique(dropna=False) == len(df_source):
+                target_column = str(source_columns[-1])
+            if (await distinct_counts(target_column))[1] == parquet_num_rows(source_path):
                 raise HTTPException(
                     status_code=400,
                     detail="Unable to infer a suitable target column automatically. Please specify a target column before running Phase 14.",
                 )
 
         # Build feature_importance from first 10 columns (excluding target if present)
-        import json
-        numeric_cols = [c for c in df_source.columns if c != target_column][:10]
+        numeric_cols = [c for c in source_columns if c != target_column][:10]
         if not numeric_cols:
-            numeric_cols = [c for c in df_source.columns[:10]]
+            numeric_cols = [c for c in source_columns[:10]]
         fi_values = {col: round(max(0.05, (len(numeric_cols) - i) / (len(numeric_cols) + 5)), 4) for i, col in enumerate(numeric_cols)}
 
         # Selected features summary
         selected_features = {
-            "n_features_original": int(len(df_source.columns)),
+            "n_features_original": int(len(source_columns)),
             "n_features_selected": int(len(numeric_cols)),
             "selected": numeric_cols,
             "target_column": target_column,
@@ -595,8 +828,7 @@ async def run_phase14(
 
         if evaluation_path.exists():
             try:
-                with open(evaluation_path, "r", encoding="utf-8") as f:
-                    existing_report = json.load(f)
+                existing_report = _load_json(evaluation_path)
                 if existing_report.get("generated_by") != stub_tag:
                     return {
                         "status": "skipped",
@@ -614,14 +846,19 @@ async def run_phase14(
 
         # Write artifacts only if missing (or overwrite stub outputs for consistency)
         evaluation_report["generated_by"] = stub_tag
-        with open(evaluation_path, "w", encoding="utf-8") as f:
-            json.dump(evaluation_report, f, indent=2)
-        with open(artifacts / "feature_importance.json", "w", encoding="utf-8") as f:
-            json.dump(fi_values, f, indent=2)
-        with open(artifacts / "selected_features.json", "w", encoding="utf-8") as f:
-            json.dump(selected_features, f, indent=2)
-        with open(artifacts / "problem_spec.json", "w", encoding="utf-8") as f:
-            json.dump({**problem_spec, "generated_by": stub_tag}, f, indent=2)
+        outputs = {
+            evaluation_path: evaluation_report,
+            artifacts / "feature_importance.json": fi_values,
+            artifacts / "selected_features.json": selected_features,
+            artifacts / "problem_spec.json": {**problem_spec, "generated_by": stub_tag},
+        }
+
+        def write_outputs() -> None:
+            for path, payload in outputs.items():
+                path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+        # One worker-thread hop for all four files
+        await asyncio.to_thread(write_outputs)
 
         return {
             "status": "success",
@@ -662,14 +899,14 @@ async def run_phase1(
         if not cleaned_data_path.exists():
             raise HTTPException(400, "No cleaned data found. Run Phase 0 first.")
         
-        df_sample = pd.read_parquet(cleaned_data_path).head(10)
+        df_sample = (await read_parquet_async(cleaned_data_path)).head(10)
         columns = df_sample.columns.tolist()
         
         # Avoid to_string() to prevent Unicode encoding issues
         data_sample = f"Shape: {df_sample.shape}, Columns: {list(df_sample.columns)}"
         
         service = GoalKPIsService(columns=columns, domain=domain, data_sample=data_sample)
-        result = service.run()
+        result = await asyncio.to_thread(service.run)
         
         if result.compatibility.status == "STOP":
             raise HTTPException(
@@ -692,14 +929,15 @@ async def run_phase2():
         if not cleaned_data_path.exists():
             raise HTTPException(400, "No cleaned data found. Run Phase 0 first.")
         
-        # Phase 2: Convert cleaned data to ingested format
-        df = pd.read_parquet(cleaned_data_path)
+        # Phase 2: Convert cleaned data to ingested format. The Arrow table is
+        # written back as-is, so no pandas conversion happens in either direction.
+        table = await asyncio.to_thread(pq.read_table, cleaned_data_path)
         
         # Create ingestion result
         result = IngestionResult(
-            rows=len(df),
-            columns=len(df.columns),
-            column_names=df.columns.tolist(),
+            rows=table.num_rows,
+            columns=table.num_columns,
+            column_names=table.column_names,
             file_size_mb=cleaned_data_path.stat().st_size / (1024 * 1024),
             parquet_path=str(settings.artifacts_dir / "ingested_data.parquet"),
             message="Data successfully ingested from cleaned data",
@@ -710,9 +948,11 @@ async def run_phase2():
         )
         
         # Save ingested data
-        df.to_parquet(
+        await asyncio.to_thread(
+            pq.write_table,
+            table,
             settings.artifacts_dir / "ingested_data.parquet",
-            compression='zstd'
+            **PARQUET_WRITE_KWARGS
         )
         
         return result
@@ -733,16 +973,17 @@ async def run_phase3():
                 detail="No ingested data found. Run Phase 2 first."
             )
         
-        df = pd.read_parquet(parquet_path)
+        df = await read_parquet_cached_async(parquet_path)
         
         # Run Phase 3
         service = SchemaService(df=df)
-        df_typed, result = service.run()
+        df_typed, result = await asyncio.to_thread(service.run)
         
         # Save typed DataFrame
-        df_typed.to_parquet(
+        await asyncio.to_thread(
+            df_typed.to_parquet,
             settings.artifacts_dir / "typed_data.parquet",
-            compression='zstd'
+            **PARQUET_WRITE_KWARGS
         )
         
         return result
@@ -758,29 +999,30 @@ async def run_combined_phases(
     key_columns: Optional[str] = Form(None)
 ):
     """Run Phases 1-3 sequentially"""
+    _check_upload_size(file)
     results = {}
     
     try:
         # Phase 1: Goal & KPIs
         phase1_result = await run_phase1(file=file, domain=domain)
-        results["phase1"] = phase1_result.dict()
+        results["phase1"] = phase1_result
         
         # Reset file pointer
         await file.seek(0)
         
         # Phase 2: Ingestion
         phase2_result = await run_phase2(file=file)
-        results["phase2"] = phase2_result.dict()
+        results["phase2"] = phase2_result
         
         # Phase 3: Schema
         phase3_result = await run_phase3()
-        results["phase3"] = phase3_result.dict()
+        results["phase3"] = phase3_result
         
-        return JSONResponse(content={
+        return {
             "status": "success",
             "phases_completed": ["phase1", "phase2", "phase3"],
             "results": results
-        })
+        }
     
     except HTTPException as e:
         raise e
@@ -799,7 +1041,7 @@ async def run_phase4():
         if not data_path.exists():
             raise HTTPException(400, "No typed data found. Run Phase 3 first.")
         
-        df = pd.read_parquet(data_path)
+        df = await read_parquet_cached_async(data_path)
         
         # Use full dataset for ML accuracy
         original_size = len(df)
@@ -807,16 +1049,15 @@ async def run_phase4():
         
         # Run Phase 4
         service = ProfilingService(df=df)
-        result = service.run()
+        result = await asyncio.to_thread(service.run)
         
         # Update row count to original size
         result.total_rows = original_size
         
         # Save profile report
-        with open(settings.artifacts_dir / "profile_summary.json", "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        (settings.artifacts_dir / "profile_summary.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
         
-        return result
+        return model_response(result)
     
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -831,11 +1072,11 @@ async def run_phase5(group_column: Optional[str] = Form(None)):
         if not data_path.exists():
             raise HTTPException(400, "No typed data found. Run Phase 3 first.")
         
-        df = pd.read_parquet(data_path)
+        df = await read_parquet_cached_async(data_path)
         
         # Run Phase 5
         service = MissingDataService(df=df, group_col=group_column)
-        df_imputed, result = service.run()
+        df_imputed, result = await asyncio.to_thread(service.run)
         
         # Stop if validation failed
         if result.status == "STOP":
@@ -845,16 +1086,16 @@ async def run_phase5(group_column: Optional[str] = Form(None)):
             )
         
         # Save imputed data
-        df_imputed.to_parquet(
+        await asyncio.to_thread(
+            df_imputed.to_parquet,
             settings.artifacts_dir / "imputed_data.parquet",
-            compression='zstd'
+            **PARQUET_WRITE_KWARGS
         )
         
         # Save imputation policy
-        with open(settings.artifacts_dir / "imputation_policy.json", "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        (settings.artifacts_dir / "imputation_policy.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
         
-        return result
+        return model_response(result)
     
     except HTTPException:
         raise
@@ -867,8 +1108,8 @@ async def run_phase10():
     """Phase 10: Packaging (Pre-Split)"""
     try:
         service = PackagingService(artifacts_dir=settings.artifacts_dir)
-        result = service.run()
-        return result
+        result = await asyncio.to_thread(service.run)
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -884,7 +1125,7 @@ async def run_phase10_5(
         if not data_path.exists():
             raise HTTPException(400, "No merged data found.")
         
-        df = pd.read_parquet(data_path)
+        df = await read_parquet_cached_async(data_path)
         
         service = SplitService(
             df=df,
@@ -892,18 +1133,21 @@ async def run_phase10_5(
             time_col=time_column
         )
         
-        df_train, df_val, df_test, result = service.run()
+        df_train, df_val, df_test, result = await asyncio.to_thread(service.run)
         
         # Save splits
-        df_train.to_parquet(settings.artifacts_dir / "train.parquet")
-        df_val.to_parquet(settings.artifacts_dir / "validation.parquet")
-        df_test.to_parquet(settings.artifacts_dir / "test.parquet")
+        await _write_parquet_files({
+            settings.artifacts_dir / "train.parquet": df_train,
+            settings.artifacts_dir / "validation.parquet": df_val,
+            settings.artifacts_dir / "test.parquet": df_test,
+        })
         
         # Save split indices
-        with open(settings.artifacts_dir / "split_indices.json", "w") as f:
-            json.dump(result.dict(), f, indent=2)
+        (settings.artifacts_dir / "split_indices.json").write_text(
+            result.model_dump_json(indent=2), encoding="utf-8"
+        )
         
-        return result
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -916,12 +1160,12 @@ async def run_phase11():
         if not data_path.exists():
             raise HTTPException(400, "No merged data found. Run Phase 8 first.")
         
-        df_train = pd.read_parquet(data_path)
+        df_train = await read_parquet_cached_async(data_path)
         
         service = AdvancedExplorationService(df=df_train)
-        result = service.run(settings.artifacts_dir)
+        result = await asyncio.to_thread(service.run, settings.artifacts_dir)
         
-        return result
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -939,8 +1183,8 @@ async def run_phase11_5(
         if not train_path.exists():
             raise HTTPException(400, "No train data found.")
         
-        df_train = pd.read_parquet(train_path)
-        df_val = pd.read_parquet(val_path)
+        df_train = await read_parquet_cached_async(train_path)
+        df_val = await read_parquet_cached_async(val_path)
         
         service = FeatureSelectionService(
             df_train=df_train,
@@ -949,24 +1193,24 @@ async def run_phase11_5(
             top_k=top_k
         )
         
-        selected_features, result = service.run()
+        selected_features, result = await asyncio.to_thread(service.run)
         
-        # Save selected features
-        with open(settings.artifacts_dir / "selected_features.json", "w") as f:
-            json.dump(result.dict(), f, indent=2)
-        # Save ranking report CSV
-        try:
-            import csv
-            ranking_csv = settings.artifacts_dir / "ranking_report.csv"
-            with open(ranking_csv, "w", newline="") as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["feature", "score", "rank"])
-                for fr in result.feature_rankings:
-                    writer.writerow([fr.feature, fr.score, fr.rank])
-        except Exception:
-            pass
+        def write_reports() -> None:
+            # Save selected features
+            (settings.artifacts_dir / "selected_features.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
+            # Save ranking report CSV
+            try:
+                ranking_csv = settings.artifacts_dir / "ranking_report.csv"
+                with open(ranking_csv, "w", newline="") as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(["feature", "score", "rank"])
+                    writer.writerows((fr.feature, fr.score, fr.rank) for fr in result.feature_rankings)
+            except Exception:
+                pass
         
-        return result
+        await asyncio.to_thread(write_reports)
+        
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -979,16 +1223,15 @@ async def run_phase13():
         if not data_path.exists():
             raise HTTPException(400, "No merged data found. Run Phase 8 first.")
         
-        df_train = pd.read_parquet(data_path)
+        df_train = await read_parquet_cached_async(data_path)
         
         service = MonitoringService(df=df_train)
-        result = service.run()
+        result = await asyncio.to_thread(service.run)
         
         # Save drift config
-        with open(settings.artifacts_dir / "drift_config.json", "w") as f:
-            json.dump(result.dict(), f, indent=2)
+        (settings.artifacts_dir / "drift_config.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
         
-        return result
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -1018,13 +1261,32 @@ async def run_phase12():
         if not data_path.exists():
             raise HTTPException(400, "No data found. Run previous phases first.")
         
-        df = pd.read_parquet(data_path)
+        # Only string-typed columns can be text; decide from the footer schema
+        # so purely numeric datasets are never decoded.
+        schema = await asyncio.to_thread(pq.read_schema, data_path)
+        text_candidates = [
+            field.name for field in schema
+            if is_text_arrow_type(field.type)
+        ]
+        if not text_candidates:
+            # An empty frame takes the orchestrator's own "skipped" path
+            return model_response(
+                await asyncio.to_thread(Phase12Orchestrator(df=pd.DataFrame()).run, settings.artifacts_dir)
+            )
+        
+        # Arrow-backed load of the candidate columns only; the text services
+        # still convert the detected text columns to Python str for per-row work
+        def load_text_candidates() -> pd.DataFrame:
+            table = pq.read_table(data_path, columns=text_candidates)
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        
+        df = await asyncio.to_thread(load_text_candidates)
         
         # Run Phase 12
         orchestrator = Phase12Orchestrator(df=df)
-        result = orchestrator.run(settings.artifacts_dir)
+        result = await asyncio.to_thread(orchestrator.run, settings.artifacts_dir)
         
-        return result
+        return model_response(result)
     
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -1040,12 +1302,12 @@ async def run_phase8():
         if not data_path.exists():
             raise HTTPException(400, "No encoded data found. Run Phase 7.5 first.")
         
-        df = pd.read_parquet(data_path)
+        df = await read_parquet_cached_async(data_path)
         
         registry = TextDatasetRegistry(settings.artifacts_dir)
         join_tables = registry.load_tables()
         service = MergingService(main_df=df, join_tables=join_tables)
-        df_merged, result = service.run(settings.artifacts_dir)
+        df_merged, result = await asyncio.to_thread(service.run, settings.artifacts_dir)
         
         if result.status == "STOP":
             # Mind-Q-V3: Auto-fix duplicate issues instead of stopping
@@ -1063,12 +1325,13 @@ async def run_phase8():
                 raise HTTPException(400, f"Merging failed: {result.issues}")
         
         # Save merged data
-        df_merged.to_parquet(
+        await asyncio.to_thread(
+            df_merged.to_parquet,
             settings.artifacts_dir / "merged_data.parquet",
-            compression='zstd'
+            **PARQUET_WRITE_KWARGS
         )
         
-        return result
+        return model_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -1081,25 +1344,20 @@ async def register_text_table(
     dataset_name: str = Form(...),
     key_column: str = Form(...),
 ):
+    _check_upload_size(file)
     try:
-        content = await file.read()
-        buffer = io.BytesIO(content)
-        filename = file.filename.lower()
-
-        if filename.endswith(".csv"):
-            df = pd.read_csv(buffer)
-        elif filename.endswith((".xlsx", ".xls")):
-            df = pd.read_excel(buffer)
-        elif filename.endswith(".parquet"):
-            df = pd.read_parquet(buffer)
-        else:
+        suffix = await _upload_suffix(file)
+        reader = _UPLOAD_READERS.get(suffix)
+        if reader is None:
             raise HTTPException(400, "Unsupported file format. Use CSV, Excel, or Parquet.")
+        # Parse straight from the spooled upload rather than a second in-memory copy
+        df = await asyncio.to_thread(reader, file.file)
 
         if key_column not in df.columns:
             raise HTTPException(400, f"Key column '{key_column}' not found in uploaded dataset.")
 
         registry = TextDatasetRegistry(settings.artifacts_dir)
-        meta = registry.register(dataset_name, key_column, df)
+        meta = await asyncio.to_thread(registry.register, dataset_name, key_column, df)
 
         return {
             "status": "registered",
@@ -1127,7 +1385,7 @@ async def run_phase9():
         
         # Load data with robust error handling
         try:
-            df = pd.read_parquet(data_path)
+            df = await read_parquet_cached_async(data_path)
         except Exception as e:
             raise HTTPException(500, f"Failed to load merged data: {str(e)}")
         
@@ -1137,19 +1395,20 @@ async def run_phase9():
         
         # The CorrelationsService now handles data type conversion internally
         service = CorrelationsService(df=df)
-        result = service.run()
+        result = await asyncio.to_thread(service.run)
         
         # Save correlation matrix with error handling
         try:
             artifacts_dir = settings.artifacts_dir
             artifacts_dir.mkdir(exist_ok=True)
-            with open(artifacts_dir / "correlation_matrix.json", "w") as f:
-                json.dump(result.model_dump(), f, indent=2)
+            # JSON stays for export bundles and BI; Phase 9.5 reads the Feather copy
+            (artifacts_dir / "correlation_matrix.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
+            write_correlation_pairs(result, artifacts_dir / "correlation_pairs.feather")
         except Exception:
             # If saving fails, continue without saving (non-critical)
             pass
         
-        return result
+        return model_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -1161,25 +1420,28 @@ async def run_phase9_5(domain: str = Form("logistics")):
     """Phase 9.5: Business Logic Validation"""
     try:
         # Load correlations from Phase 9
+        pairs_path = settings.artifacts_dir / "correlation_pairs.feather"
         corr_path = settings.artifacts_dir / "correlation_matrix.json"
-        if not corr_path.exists():
+        if pairs_path.exists():
+            corr_items = read_correlation_pairs(pairs_path)
+        elif corr_path.exists():
+            # Artifacts from runs before the Feather copy was written
+            corr_data = _load_json(corr_path)
+            corr_items = corr_data.get("numeric_correlations", []) + corr_data.get("categorical_associations", [])
+        else:
             raise HTTPException(400, "No correlations found. Run Phase 9 first.")
         
-        with open(corr_path) as f:
-            corr_data = json.load(f)
-        
         # Extract correlations
         correlations = []
-        for item in corr_data.get("numeric_correlations", []) + corr_data.get("categorical_associations", []):
+        for item in corr_items:
             # Reconstruct minimal structure expected by BusinessValidationService
-            from types import SimpleNamespace
             correlations.append(SimpleNamespace(**item))
         
         service = BusinessValidationService(
             correlations=correlations,
             domain=domain
         )
-        result = service.run()
+        result = await asyncio.to_thread(service.run)
         
         if result.status == "STOP":
             raise HTTPException(
@@ -1188,10 +1450,9 @@ async def run_phase9_5(domain: str = Form("logistics")):
             )
         
         # Save business veto report
-        with open(settings.artifacts_dir / "business_veto_report.json", "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        (settings.artifacts_dir / "business_veto_report.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
         
-        return result
+        return model_response(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -1206,18 +1467,19 @@ async def run_phase6(domain: str = Form("logistics")):
         if not data_path.exists():
             raise HTTPException(400, "No imputed data found. Run Phase 5 first.")
         
-        df = pd.read_parquet(data_path)
+        df = await read_parquet_cached_async(data_path)
         
         service = StandardizationService(df=df, domain=domain)
-        df_std, result = service.run()
+        df_std, result = await asyncio.to_thread(service.run)
         
         # Save standardized data
-        df_std.to_parquet(
+        await asyncio.to_thread(
+            df_std.to_parquet,
             settings.artifacts_dir / "standardized_data.parquet",
-            compression='zstd'
+            **PARQUET_WRITE_KWARGS
         )
         
-        return result
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -1230,22 +1492,22 @@ async def run_phase7(domain: str = Form("logistics")):
         if not data_path.exists():
             raise HTTPException(400, "No standardized data found. Run Phase 6 first.")
         
-        df = pd.read_parquet(data_path)
+        df = await read_parquet_cached_async(data_path)
         
         service = FeatureDraftService(df=df, domain=domain)
-        df_features, result = service.run()
+        df_features, result = await asyncio.to_thread(service.run)
         
         # Save feature data
-        df_features.to_parquet(
+        await asyncio.to_thread(
+            df_features.to_parquet,
             settings.artifacts_dir / "features_data.parquet",
-            compression='zstd'
+            **PARQUET_WRITE_KWARGS
         )
         
         # Save feature spec
-        with open(settings.artifacts_dir / "feature_spec.json", "w") as f:
-            json.dump(result.model_dump(), f, indent=2)
+        (settings.artifacts_dir / "feature_spec.json").write_text(result.model_dump_json(indent=2), encoding="utf-8")
         
-        return result
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -1262,7 +1524,7 @@ async def run_phase7_5(
         if not data_path.exists():
             raise HTTPException(400, "No feature data found. Run Phase 7 first.")
         
-        df_train = pd.read_parquet(data_path)
+        df_train = await read_parquet_cached_async(data_path)
         df_val = None
         df_test = None
         
@@ -1274,16 +1536,19 @@ async def run_phase7_5(
             domain=domain
         )
         
-        df_train_enc, df_val_enc, df_test_enc, result = service.run(settings.artifacts_dir)
+        df_train_enc, df_val_enc, df_test_enc, result = await asyncio.to_thread(
+            service.run, settings.artifacts_dir
+        )
         
         # Save encoded data
-        df_train_enc.to_parquet(settings.artifacts_dir / "encoded_data.parquet", compression='zstd')
+        encoded = {settings.artifacts_dir / "encoded_data.parquet": df_train_enc}
         if df_val_enc is not None:
-            df_val_enc.to_parquet(settings.artifacts_dir / "val_encoded.parquet", compression='zstd')
+            encoded[settings.artifacts_dir / "val_encoded.parquet"] = df_val_enc
         if df_test_enc is not None:
-            df_test_enc.to_parquet(settings.artifacts_dir / "test_encoded.parquet", compression='zstd')
+            encoded[settings.artifacts_dir / "test_encoded.parquet"] = df_test_enc
+        await _write_parquet_files(encoded)
         
-        return result
+        return model_response(result)
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -1295,32 +1560,120 @@ async def workflow_domain_check(
     """
     Combined workflow: Upload file, check domain compatibility
     """
+    _check_upload_size(file)
+    tmp_path = None
     try:
-        # Read file
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(file.file)
-        elif file.filename.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file.file)
-        else:
+        suffix = await _upload_suffix(file)
+        if suffix not in ('.csv', '.xlsx', '.xls'):
             raise HTTPException(status_code=400, detail="Only CSV and Excel files supported")
         
+        tmp_path = await _spool_upload(file, suffix)
+        # Compatibility only needs the header row
+        header = await asyncio.to_thread(_read_upload, tmp_path, header_only=True)
+        columns = header.columns.tolist()
+        
         # Check domain compatibility
         service = get_phase1_service()
-        compatibility_result = service.check_domain_compatibility(domain, df.columns.tolist())
+        compatibility_result = service.check_domain_compatibility(domain, columns)
+        
+        # Row count from a single projected column rather than the full frame
+        rows = 0
+        if columns:
+            first_column = await asyncio.to_thread(_read_upload, tmp_path, usecols=[columns[0]])
+            rows = len(first_column)
         
         return {
             "file_info": {
                 "filename": file.filename,
-                "rows": len(df),
-                "columns": df.columns.tolist()
+                "rows": rows,
+                "columns": columns
             },
-            "compatibility": compatibility_result.data.dict() if compatibility_result.data else None,
+            "compatibility": compatibility_result.data,
             "status": compatibility_result.status,
             "message": compatibility_result.message
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if tmp_path:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+
+
+async def _full_pipeline_steps(
+    tmp_path: Path,
+    columns: List[str],
+    domain: str,
+    auto_ingest: bool,
+    auto_validate: bool
+):
+    """Run domain check → ingest → schema validate, yielding each step's result as it completes"""
+    # Step 1: Domain compatibility check
+    phase1_service = get_phase1_service()
+    compatibility_result = await asyncio.to_thread(
+        phase1_service.check_domain_compatibility, domain, columns
+    )
+    
+    yield {
+        "step": "domain_compatibility",
+        "status": compatibility_result.status,
+        "result": compatibility_result.data
+    }
+    
+    # If domain compatibility is OK or WARN, proceed with ingestion
+    if not (compatibility_result.data and compatibility_result.data.status in ["OK", "WARN"] and auto_ingest):
+        return
+    
+    # Step 2: Ingest data
+    phase2_service = get_phase2_service()
+    # Known domains declare their column dtypes so the CSV reader
+    # skips inference for those columns
+    config = IngestionConfig(source_file=str(tmp_path), dtype=DOMAIN_DTYPES.get(domain))
+    async with _INGEST_SEM:
+        ingestion_result = await asyncio.to_thread(phase2_service.ingest_data, tmp_path, config)
+    
+    yield {
+        "step": "ingestion",
+        "status": ingestion_result.status,
+        "result": ingestion_result.data
+    }
+    
+    # Step 3: Schema validation
+    if ingestion_result.data and auto_validate:
+        phase3_service = get_phase3_service()
+        async with _INGEST_SEM:
+            schema_result = await asyncio.to_thread(
+                phase3_service.validate_and_enforce_schema,
+                ingestion_result.data.target_file,
+                domain
+            )
+        
+        yield {
+            "step": "schema_validation",
+            "status": schema_result.status,
+            "result": schema_result.data
+        }
+
+
+async def _spool_pipeline_upload(file: UploadFile) -> tuple[Path, list[str]]:
+    """Validate and spool a full-pipeline upload, returning its path and header columns"""
+    _check_upload_size(file)
+    suffix = await _upload_suffix(file)
+    if suffix not in ('.csv', '.xlsx', '.xls'):
+        raise HTTPException(status_code=400, detail="Only CSV and Excel files supported")
+    
+    # Keep the original bytes and extension so Phase 2 parses the upload
+    # exactly once, in its own format
+    tmp_path = await _spool_upload(file, suffix)
+    try:
+        # Header only; the row count comes from ingestion
+        header = await asyncio.to_thread(_read_upload, tmp_path, header_only=True)
+    except BaseException:
+        await anyio.Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return tmp_path, header.columns.tolist()
 
 
 @router.post("/workflow/full-pipeline")
@@ -1333,70 +1686,65 @@ async def workflow_full_pipeline(
     """
     Full pipeline: Upload → Domain Check → Ingest → Schema Validate
     """
+    tmp_path = None
     try:
-        # Read file
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(file.file)
-        elif file.filename.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file.file)
-        else:
-            raise HTTPException(status_code=400, detail="Only CSV and Excel files supported")
+        tmp_path, columns = await _spool_pipeline_upload(file)
         
         results = {
             "file_info": {
                 "filename": file.filename,
-                "rows": len(df),
-                "columns": df.columns.tolist()
+                "rows": None,
+                "columns": columns
             },
             "steps": []
         }
         
-        # Step 1: Domain compatibility check
-        phase1_service = get_phase1_service()
-        compatibility_result = phase1_service.check_domain_compatibility(domain, df.columns.tolist())
-        
-        results["steps"].append({
-            "step": "domain_compatibility",
-            "status": compatibility_result.status,
-            "result": compatibility_result.data.dict() if compatibility_result.data else None
-        })
-        
-        # If domain compatibility is OK or WARN, proceed with ingestion
-        if compatibility_result.data and compatibility_result.data.status in ["OK", "WARN"] and auto_ingest:
-            # Save file temporarily for ingestion
-            import tempfile
-            import os
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.filename.split('.')[-1]}") as tmp_file:
-                df.to_csv(tmp_file.name, index=False)
-                
-                # Step 2: Ingest data
-                phase2_service = get_phase2_service()
-                ingestion_result = phase2_service.ingest_data(tmp_file.name)
-                
-                results["steps"].append({
-                    "step": "ingestion",
-                    "status": ingestion_result.status,
-                    "result": ingestion_result.data.dict() if ingestion_result.data else None
-                })
-                
-                # Step 3: Schema validation
-                if ingestion_result.data and auto_validate:
-                    phase3_service = get_phase3_service()
-                    schema_result = phase3_service.validate_and_enforce_schema(
-                        ingestion_result.data.target_file, domain
-                    )
-                    
-                    results["steps"].append({
-                        "step": "schema_validation",
-                        "status": schema_result.status,
-                        "result": schema_result.data.dict() if schema_result.data else None
-                    })
-                
-                # Clean up temp file
-                os.unlink(tmp_file.name)
+        async for step in _full_pipeline_steps(tmp_path, columns, domain, auto_ingest, auto_validate):
+            results["steps"].append(step)
+            if step["step"] == "ingestion" and step["result"]:
+                results["file_info"]["rows"] = step["result"].rows_ingested
         
         return results
     
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if tmp_path:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+
+
+@router.post("/workflow/full-pipeline/stream")
+async def workflow_full_pipeline_stream(
+    file: UploadFile = File(...),
+    domain: str = "general",
+    auto_ingest: bool = True,
+    auto_validate: bool = True
+):
+    """
+    Full pipeline as NDJSON: a file_info line, then one line per step as it completes
+    """
+    try:
+        tmp_path, columns = await _spool_pipeline_upload(file)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    def encode(line: dict) -> bytes:
+        return orjson.dumps(line, default=jsonable_encoder, option=orjson.OPT_APPEND_NEWLINE)
+    
+    async def lines():
+        # The response outlives the handler, so the spooled file is removed here
+        try:
+            yield encode({"file_info": {"filename": file.filename, "columns": columns}})
+            async for step in _full_pipeline_steps(tmp_path, columns, domain, auto_ingest, auto_validate):
+                yield encode(step)
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            yield encode({"step": "error", "status": "error", "detail": str(e)})
+        finally:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,15 @@
+"""
+Shared response helpers for the v1 API routers
+"""
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def model_response(result: BaseModel) -> ORJSONResponse:
+    """
+    Encode a result model directly. Returning the model itself would make
+    FastAPI dump it, re-validate it against ``response_model`` and serialise
+    it again; the route's ``response_model`` still documents the schema.
+    """
+    return ORJSONResponse(result.model_dump(mode="json"))
@@ -33,6 +33,9 @@ class Settings(BaseSettings):
     ]
     
     max_file_size_mb: int = 500
+    # Uploads are spooled here (tmpfs by default) while a request parses
+    # them; the system temp dir is used when it is missing or short on space
+    upload_tmp_dir: Path = Path("/dev/shm")
     
     llm_provider: str = "gemini"
     gemini_api_key: str = ""
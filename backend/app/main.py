@@ -1,5 +1,9 @@
+import os
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from app.config import settings
 from app.api.v1.router import api_router
@@ -8,7 +12,9 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.version,
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    # Every router encodes its JSON bodies with orjson unless a route says otherwise
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -26,6 +32,14 @@ app.include_router(api_router, prefix="/api/v1")
 # Static files for artifacts download
 app.mount("/artifacts", StaticFiles(directory=str(settings.artifacts_dir)), name="artifacts")
 
+@app.on_event("startup")
+async def configure_worker_threads():
+    # Upload reads and sync dependencies run on anyio's worker threads; make
+    # sure the pool is not smaller than two threads per core
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, (os.cpu_count() or 1) * 2)
+
+
 @app.get("/health")
 async def health_check():
     return {
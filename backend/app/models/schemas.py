@@ -142,6 +142,7 @@ class IngestionConfig(BaseModel):
     compression: str = Field(default="zstd", description="Compression algorithm")
     chunk_size: Optional[int] = Field(None, description="Chunk size for large files")
     preserve_index: bool = Field(default=False, description="Whether to preserve DataFrame index")
+    dtype: Optional[Dict[str, str]] = Field(None, description="Column dtypes declared up front for CSV sources")
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -2,28 +2,43 @@
 Services module for the EDA platform.
 """
 
-from .phase0_quality_control import QualityControlService, QualityControlResult
-from .phase1_goal_kpis import Phase1Service, GoalKPIsService, GoalKPIsResult, DomainCompatibilityResult
-from .phase2_ingestion import Phase2IngestionService, IngestionService, IngestionResult
-from .phase3_schema import Phase3SchemaService, SchemaService, SchemaResult
-from .domain_packs import DomainPack, DOMAIN_PACKS, get_domain_pack, suggest_domain
+import importlib
 
-__all__ = [
-    "QualityControlService",
-    "QualityControlResult",
-    "Phase1Service",
-    "GoalKPIsService",
-    "GoalKPIsResult",
-    "DomainCompatibilityResult",
-    "Phase2IngestionService",
-    "IngestionService",
-    "IngestionResult",
-    "Phase3SchemaService",
-    "SchemaService",
-    "SchemaResult",
-    "DomainPack",
-    "DOMAIN_PACKS",
-    "get_domain_pack",
-    "suggest_domain"
-]
+# Exported name -> defining submodule. Resolved on first attribute access
+# (PEP 562) so importing one service, e.g. ``app.services.phase5_missing_data``,
+# does not also load every phase below and their LLM client dependencies.
+_LAZY_EXPORTS = {
+    "QualityControlService": ".phase0_quality_control",
+    "QualityControlResult": ".phase0_quality_control",
+    "Phase1Service": ".phase1_goal_kpis",
+    "GoalKPIsService": ".phase1_goal_kpis",
+    "GoalKPIsResult": ".phase1_goal_kpis",
+    "DomainCompatibilityResult": ".phase1_goal_kpis",
+    "Phase2IngestionService": ".phase2_ingestion",
+    "IngestionService": ".phase2_ingestion",
+    "IngestionResult": ".phase2_ingestion",
+    "Phase3SchemaService": ".phase3_schema",
+    "SchemaService": ".phase3_schema",
+    "SchemaResult": ".phase3_schema",
+    "DomainPack": ".domain_packs",
+    "DOMAIN_PACKS": ".domain_packs",
+    "DOMAIN_DTYPES": ".domain_packs",
+    "get_domain_pack": ".domain_packs",
+    "suggest_domain": ".domain_packs",
+}
 
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
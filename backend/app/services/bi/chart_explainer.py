@@ -1,6 +1,8 @@
 from __future__ import annotations
+import copy
 import json
 import re
+from functools import lru_cache
 from typing import Dict, Callable
 
 # Forbidden causal terms
@@ -72,6 +74,21 @@ def explain_chart(
 Return ONLY JSON (no additional text):
 """
     
+    out = _guarded_explanation(prompt, llm_call, str(signals["meta"]["n"]), signals["meta"]["time_window"])
+    # Callers own the result; the cached copy must stay untouched
+    return copy.deepcopy(out)
+
+
+# Explanations that passed the guardrails, keyed by the exact prompt (which
+# embeds the signals and chart metadata), so re-rendering an unchanged chart
+# skips the LLM round trip. Failed calls raise and are not cached.
+@lru_cache(maxsize=64)
+def _guarded_explanation(
+    prompt: str,
+    llm_call: Callable[[str], str],
+    n: str,
+    time_window: str
+) -> Dict:
     raw = llm_call(prompt).strip()
     
     # Clean markdown if present
@@ -90,10 +107,10 @@ Return ONLY JSON (no additional text):
     ])
     
     # Must mention n
-    assert str(signals["meta"]["n"]) in full_text, "Explanation must mention sample size n"
+    assert n in full_text, "Explanation must mention sample size n"
     
     # Must mention time_window
-    assert signals["meta"]["time_window"] in full_text, "Explanation must mention time window"
+    assert time_window in full_text, "Explanation must mention time window"
     
     # No forbidden causal terms
     assert not _contains_forbidden(full_text), "Explanation contains forbidden causal language"
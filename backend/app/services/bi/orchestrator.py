@@ -107,7 +107,7 @@ class BIOrchestrator:
         
         return BIResponse(
             query=user_question,
-            parsed=parsed_query.dict(),
+            parsed=parsed_query.model_dump(),
             chart=chart,
             explanation=explanation,
             recommendations=pre_recs,
@@ -69,6 +69,34 @@ DOMAIN_PACKS: Dict[str, DomainPack] = {
 }
 
 
+# CSV dtypes declared up front for each domain's expected columns, so the
+# reader skips inference for them. Only types Phase 3 would enforce anyway:
+# IDs as strings and numeric measures as floats.
+DOMAIN_DTYPES: Dict[str, Dict[str, str]] = {
+    "logistics": {
+        "shipment_id": "string", "order_id": "string",
+        "transit_time": "float64", "dwell_time": "float64",
+    },
+    "healthcare": {
+        "patient_id": "string",
+        "los_days": "float64", "age": "float64",
+    },
+    "emarketing": {
+        "campaign_id": "string",
+        "spend": "float64", "impressions": "float64",
+        "clicks": "float64", "conversions": "float64",
+    },
+    "retail": {
+        "order_id": "string", "customer_id": "string", "product_id": "string",
+        "quantity": "float64", "price": "float64",
+    },
+    "finance": {
+        "account_id": "string", "customer_id": "string",
+        "balance": "float64", "interest_rate": "float64",
+    },
+}
+
+
 def get_domain_pack(domain_name: str) -> DomainPack:
     """Get domain pack by name"""
     if domain_name not in DOMAIN_PACKS:
@@ -79,15 +107,14 @@ def get_domain_pack(domain_name: str) -> DomainPack:
 def suggest_domain(columns: List[str]) -> Dict[str, float]:
     """Suggest domain based on column names"""
     matches = {}
-    
+    # Lowercased once for all packs; a set keeps wide datasets linear
+    columns_lower = {c.lower() for c in columns}
+
     for domain_name, pack in DOMAIN_PACKS.items():
-        expected_lower = [c.lower() for c in pack.expected_columns]
-        columns_lower = [c.lower() for c in columns]
-        
-        match_count = sum(1 for col in expected_lower if col in columns_lower)
+        match_count = sum(1 for col in pack.expected_columns if col.lower() in columns_lower)
         # Balanced coverage: average of coverage over expected and over provided columns
         coverage_expected = match_count / len(pack.expected_columns)
-        coverage_provided = match_count / max(len(columns_lower), 1)
+        coverage_provided = match_count / max(len(columns), 1)
         adjusted = 0.5 * (coverage_expected + coverage_provided)
         matches[domain_name] = round(adjusted, 3)
     
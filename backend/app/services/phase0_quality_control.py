@@ -8,6 +8,8 @@ import pandas as pd
 from datetime import datetime
 from pydantic import BaseModel
 
+from ..utils.parquet_io import PARQUET_WRITE_KWARGS
+
 
 class QualityControlResult(BaseModel):
     """Result model for quality control checks"""
@@ -274,7 +276,7 @@ class QualityControlService:
         try:
             from ..config import settings
             cleaned_path = settings.artifacts_dir / "cleaned_data.parquet"
-            self.df.to_parquet(cleaned_path, compression='zstd')
+            self.df.to_parquet(cleaned_path, **PARQUET_WRITE_KWARGS)
             self.fixes_applied.append(f"Saved cleaned data to {cleaned_path}")
         except Exception as e:
             self.warnings.append(f"Failed to save cleaned data: {str(e)}")
@@ -1,6 +1,5 @@
 from typing import Tuple
 import pandas as pd
-from sklearn.model_selection import train_test_split
 from pydantic import BaseModel
 import json
 
@@ -58,6 +57,7 @@ class SplitService:
     
     def _stratified_split(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Stratified split maintaining target distribution"""
+        from sklearn.model_selection import train_test_split
         
         # First split: train+val vs test
         if self.target_col and self.target_col in self.df.columns:
@@ -1,10 +1,6 @@
 from typing import List, Tuple
 import pandas as pd
 import numpy as np
-from sklearn.feature_selection import RFE
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.linear_model import LogisticRegression
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 from pydantic import BaseModel
 
 
@@ -86,6 +82,7 @@ class FeatureSelectionService:
     
     def _model_based_ranking(self, X: pd.DataFrame, y: pd.Series) -> dict:
         """Rank features using Random Forest importance"""
+        from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
         
         # Determine if classification or regression
         if y.dtype == 'object' or y.nunique() < 10:
@@ -101,6 +98,8 @@ class FeatureSelectionService:
     
     def _recursive_feature_elimination(self, X: pd.DataFrame, y: pd.Series) -> List[str]:
         """Select features using RFE"""
+        from sklearn.feature_selection import RFE
+        from sklearn.linear_model import LogisticRegression
         
         # Use logistic regression for RFE (fast)
         estimator = LogisticRegression(max_iter=1000, random_state=42)
@@ -141,6 +140,7 @@ class FeatureSelectionService:
     
     def _check_vif(self, X: pd.DataFrame) -> bool:
         """Check Variance Inflation Factor"""
+        from statsmodels.stats.outliers_influence import variance_inflation_factor
         
         if len(X.columns) < 2:
             return True
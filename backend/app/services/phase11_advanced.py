@@ -1,11 +1,6 @@
 from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
 from pydantic import BaseModel
 import json
 
@@ -48,6 +43,7 @@ class AdvancedExplorationService:
         X = self.df[numeric_cols].fillna(0)
         
         # Scale features
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_scaled = scaler.fit_transform(X)
         
@@ -73,6 +69,8 @@ class AdvancedExplorationService:
     
     def _perform_clustering(self, X: np.ndarray) -> Optional[ClusteringResult]:
         """Perform K-Means clustering with silhouette evaluation"""
+        from sklearn.cluster import KMeans
+        from sklearn.metrics import silhouette_score
         
         best_k = 2
         best_score = -1
@@ -102,6 +100,7 @@ class AdvancedExplorationService:
     
     def _perform_pca(self, X: np.ndarray, artifacts_dir) -> List[float]:
         """Perform PCA and save components"""
+        from sklearn.decomposition import PCA
         
         pca = PCA(n_components=0.90, random_state=self.random_state)  # 90% variance
         pca.fit(X)
@@ -122,6 +121,7 @@ class AdvancedExplorationService:
     
     def _detect_anomalies(self, X: np.ndarray, artifacts_dir) -> tuple[int, float]:
         """Detect anomalies using Isolation Forest"""
+        from sklearn.ensemble import IsolationForest
         
         iso_forest = IsolationForest(
             contamination=0.05,
@@ -6,6 +6,7 @@ Detects text columns in the dataset and analyzes language.
 
 from typing import List
 import pandas as pd
+import pyarrow as pa
 from pydantic import BaseModel
 
 
@@ -60,8 +61,7 @@ class TextDetectionService:
 
         for col in sample_df.columns:
             series = sample_df[col]
-            dtype_str = str(series.dtype)
-            if dtype_str not in {"object", "string"} and "category" not in dtype_str.lower():
+            if not _is_text_dtype(series.dtype):
                 continue
 
             # Drop nulls for metrics
@@ -140,6 +140,23 @@ class TextDetectionService:
             return "Text analysis recommended (MVP: Basic + Sentiment)"
 
 
+def is_text_arrow_type(arrow_type: pa.DataType) -> bool:
+    """String, large string, or dictionary-encoded (categorical) string Arrow types"""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def _is_text_dtype(dtype) -> bool:
+    """Object, string, categorical, or Arrow-backed string columns can hold text"""
+    if isinstance(dtype, pd.ArrowDtype):
+        # Nested Arrow types (list<string>, struct<...>) are not free text
+        return is_text_arrow_type(dtype.pyarrow_dtype)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return True
+    return pd.api.types.is_string_dtype(dtype)
+
+
 def _alphabetic_ratio(value: str) -> float:
     if not value:
         return 0.0
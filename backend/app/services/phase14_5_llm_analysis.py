@@ -1,7 +1,9 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import TypeAdapter
 
 from app.services.llm.analyzers import (
     FeatureAnalyzer,
@@ -10,9 +12,13 @@ from app.services.llm.analyzers import (
     RecommendationGenerator,
     ExecutiveSummaryGenerator,
 )
-from app.models.phase14_5_result import Phase14_5Result, DecisionLogEntry
+from app.models.phase14_5_result import Phase14_5Result, DecisionLogEntry, Recommendation
 from app.config import settings
 
+# Serialisers for the list artifacts written next to the full report
+_RECOMMENDATIONS = TypeAdapter(List[Recommendation])
+_DECISION_LOG = TypeAdapter(List[DecisionLogEntry])
+
 
 class LLMAnalysisService:
     def __init__(self, artifacts_dir: Path | None = None):
@@ -108,16 +114,13 @@ class LLMAnalysisService:
 
     def _save_result(self, result: Phase14_5Result) -> None:
         insights_path = self.artifacts_dir / "llm_insights_report.json"
-        with open(insights_path, "w", encoding="utf-8") as f:
-            json.dump(result.dict(), f, indent=2, ensure_ascii=False)
+        insights_path.write_text(result.model_dump_json(indent=2), encoding="utf-8")
 
         recs_path = self.artifacts_dir / "recommendations.json"
-        with open(recs_path, "w", encoding="utf-8") as f:
-            json.dump([rec.dict() for rec in result.recommendations], f, indent=2, ensure_ascii=False)
+        recs_path.write_bytes(_RECOMMENDATIONS.dump_json(result.recommendations, indent=2))
 
         log_path = self.artifacts_dir / "decision_log.json"
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump([entry.dict() for entry in result.decision_log], f, indent=2, ensure_ascii=False)
+        log_path.write_bytes(_DECISION_LOG.dump_json(result.decision_log, indent=2))
 
     def _load_optional_json(self, filename: str) -> Optional[dict]:
         path = self.artifacts_dir / filename
@@ -453,9 +453,9 @@ class Phase1Service:
                 status="success",
                 message="Phase 1 configuration retrieved successfully",
                 data={
-                    "domain_selection": config.domain_selection.dict() if config.domain_selection else None,
-                    "goals": [goal.dict() for goal in config.goals],
-                    "kpis": [kpi.dict() for kpi in config.kpis],
+                    "domain_selection": config.domain_selection.model_dump() if config.domain_selection else None,
+                    "goals": [goal.model_dump() for goal in config.goals],
+                    "kpis": [kpi.model_dump() for kpi in config.kpis],
                     "created_at": config.created_at.isoformat(),
                     "updated_at": config.updated_at.isoformat()
                 }
@@ -591,4 +591,4 @@ class Phase1Service:
     def _save_config(self, config: Phase1Config) -> None:
         """Save configuration to file"""
         with open(self.config_file, 'w') as f:
-            json.dump(config.dict(), f, indent=2, default=str)
+            json.dump(config.model_dump(), f, indent=2, default=str)
@@ -6,17 +6,22 @@ Handles reliable data ingestion into Parquet format with compression.
 import pandas as pd
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, Union, Dict
+from typing import Iterable, Optional, Union, Dict
 from datetime import datetime
 import pyarrow.parquet as pq
 import pyarrow as pa
 from pydantic import BaseModel
 
+from ..models import schemas
 from ..models.schemas import (
     IngestionConfig, IngestionResult, Phase2IngestionResponse
 )
 from ..config import settings
+from ..utils.excel_io import read_excel
+from ..utils.parquet_io import PARQUET_WRITE_KWARGS
 
 
 class IngestionResult(BaseModel):
@@ -114,7 +119,7 @@ class IngestionService:
                 if df is None or len(df) == 0:
                     raise ValueError(f"Mind-Q CSV recovery failed in Phase 2: {str(e)}")
         elif suffix in ['.xlsx', '.xls']:
-            df = pd.read_excel(self.file_path)
+            df = read_excel(self.file_path)
         else:
             raise ValueError(f"Unsupported file type: {suffix}")
         
@@ -150,16 +155,15 @@ class IngestionService:
         table = pa.Table.from_pandas(df)
         
         # Write with zstd compression
-        pq.write_table(
-            table,
-            output_path,
-            compression='zstd',
-            compression_level=3
-        )
+        pq.write_table(table, output_path, **PARQUET_WRITE_KWARGS)
         
         return output_path
 
 
+# Rows per CSV chunk when streaming into Parquet row groups
+CSV_CHUNK_ROWS = 500_000
+
+
 class Phase2IngestionService:
     """
     Service for managing Phase 2: Data Ingestion
@@ -208,30 +212,36 @@ class Phase2IngestionService:
             target_filename = f"{source_path.stem}_ingested.parquet"
             target_path = self.landing_dir / target_filename
             
-            # Read source data
-            df = self._read_source_file(source_path)
-            
-            # Apply chunking if needed
-            if use_chunking and config.chunk_size:
-                self._ingest_with_chunking(df, target_path, config)
+            if source_path.suffix.lower() == '.csv':
+                # CSV is parsed chunk by chunk so memory stays bounded by the
+                # chunk size rather than the file size
+                n_rows, n_columns = self._ingest_csv_stream(source_path, target_path, config)
             else:
-                self._ingest_direct(df, target_path, config)
+                # Read source data
+                df = self._read_source_file(source_path)
+                n_rows, n_columns = len(df), len(df.columns)
+                
+                # Apply chunking if needed
+                if use_chunking and config.chunk_size:
+                    self._ingest_with_chunking(df, target_path, config)
+                else:
+                    self._ingest_direct(df, target_path, config)
             
             # Calculate metrics
             ingestion_time = time.time() - start_time
             target_size_mb = target_path.stat().st_size / (1024 * 1024)
             compression_ratio = file_size_mb / target_size_mb if target_size_mb > 0 else 1.0
             
-            result = IngestionResult(
+            result = schemas.IngestionResult(
                 source_file=str(source_path),
                 target_file=str(target_path),
-                rows_ingested=len(df),
-                columns_ingested=len(df.columns),
+                rows_ingested=n_rows,
+                columns_ingested=n_columns,
                 file_size_mb=target_size_mb,
                 compression_ratio=compression_ratio,
                 ingestion_time_seconds=ingestion_time,
                 status="success",
-                message=f"Successfully ingested {len(df):,} rows to Parquet format"
+                message=f"Successfully ingested {n_rows:,} rows to Parquet format"
             )
             
             return Phase2IngestionResponse(
@@ -253,7 +263,7 @@ class Phase2IngestionService:
         if file_extension == '.csv':
             return pd.read_csv(source_path)
         elif file_extension in ['.xlsx', '.xls']:
-            return pd.read_excel(source_path)
+            return read_excel(source_path)
         elif file_extension == '.parquet':
             return pd.read_parquet(source_path)
         elif file_extension == '.json':
@@ -273,25 +283,65 @@ class Phase2IngestionService:
         """Ingest with chunking for large files"""
         chunk_size = config.chunk_size or 10000  # Default chunk size
         
-        # Write first chunk
-        first_chunk = df.iloc[:chunk_size]
-        first_chunk.to_parquet(
-            target_path,
-            compression=config.compression,
-            index=config.preserve_index
+        chunks = (df.iloc[i:i + chunk_size] for i in range(0, len(df), chunk_size))
+        self.ingest_stream(chunks, target_path, config)
+    
+    def _ingest_csv_stream(self, source_path: Path, target_path: Path, config: IngestionConfig) -> tuple[int, int]:
+        """Stream a CSV into Parquet, falling back to a full read on dtype drift"""
+        reader = pd.read_csv(
+            source_path, chunksize=config.chunk_size or CSV_CHUNK_ROWS, dtype=config.dtype
         )
-        
-        # Append remaining chunks
-        for i in range(chunk_size, len(df), chunk_size):
-            chunk = df.iloc[i:i + chunk_size]
-            chunk_df = pd.read_parquet(target_path)
-            combined_df = pd.concat([chunk_df, chunk], ignore_index=True)
-            combined_df.to_parquet(
-                target_path,
-                compression=config.compression,
-                index=config.preserve_index
+        try:
+            # The prefetch thread is stopped before the reader is closed
+            with reader, closing(_prefetch(reader)) as chunks:
+                return self.ingest_stream(chunks, target_path, config)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # A later chunk inferred a type the first chunk's schema cannot
+            # hold (e.g. ints gaining NaNs); parse the whole file instead
+            df = self._read_source_file(source_path)
+            self._ingest_direct(df, target_path, config)
+            return len(df), len(df.columns)
+        except ValueError:
+            if not config.dtype:
+                raise
+            # A declared dtype does not fit this file's values; infer instead
+            return self._ingest_csv_stream(
+                source_path, target_path, config.model_copy(update={"dtype": None})
             )
     
+    def ingest_stream(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        target_path: Path,
+        config: IngestionConfig
+    ) -> tuple[int, int]:
+        """
+        Write DataFrame chunks to one Parquet file, one row group per chunk.
+        
+        The first chunk fixes the schema; later chunks are cast to it.
+        Returns (rows, columns) written.
+        """
+        writer = None
+        n_rows = 0
+        n_columns = 0
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(
+                    chunk, preserve_index=config.preserve_index, nthreads=os.cpu_count()
+                )
+                if writer is None:
+                    schema = table.schema
+                    n_columns = len(chunk.columns)
+                    writer = pq.ParquetWriter(target_path, schema, compression=config.compression)
+                else:
+                    table = table.cast(schema)
+                writer.write_table(table)
+                n_rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return n_rows, n_columns
+    
     def get_ingestion_status(self, target_file: str) -> Phase2IngestionResponse:
         """Get status of ingested file"""
         try:
@@ -306,7 +356,7 @@ class Phase2IngestionService:
             df = pd.read_parquet(target_path)
             file_size_mb = target_path.stat().st_size / (1024 * 1024)
             
-            result = IngestionResult(
+            result = schemas.IngestionResult(
                 source_file="unknown",
                 target_file=str(target_path),
                 rows_ingested=len(df),
@@ -365,3 +415,13 @@ class Phase2IngestionService:
                 status="error",
                 message=f"Failed to list ingested files: {str(e)}"
             )
+
+
+def _prefetch(chunks: Iterable[pd.DataFrame]) -> Iterable[pd.DataFrame]:
+    """Yield chunks while the next one is parsed on a worker thread"""
+    iterator = iter(chunks)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-read") as pool:
+        pending = pool.submit(next, iterator, None)
+        while (chunk := pending.result()) is not None:
+            pending = pool.submit(next, iterator, None)
+            yield chunk
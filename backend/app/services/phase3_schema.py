@@ -17,6 +17,8 @@ from ..models.schemas import (
     SchemaValidationResult, Phase3SchemaResponse
 )
 from ..config import settings
+from ..utils.frame_info import dtype_names
+from ..utils.parquet_io import PARQUET_WRITE_KWARGS
 
 
 class SchemaResult(BaseModel):
@@ -47,7 +49,7 @@ class SchemaService:
         categorized = self._categorize_columns(df_typed)
         
         result = SchemaResult(
-            dtypes={col: str(dtype) for col, dtype in df_typed.dtypes.items()},
+            dtypes=dtype_names(df_typed),
             id_columns=categorized['id_columns'],
             datetime_columns=categorized['datetime_columns'],
             numeric_columns=categorized['numeric_columns'],
@@ -236,10 +238,10 @@ class Phase3SchemaService:
             # Save processed data
             processed_filename = f"{file_path.stem}_processed.parquet"
             processed_path = self.processed_dir / processed_filename
-            df_processed.to_parquet(processed_path, compression="zstd")
+            df_processed.to_parquet(processed_path, **PARQUET_WRITE_KWARGS)
             
             # Get final column types
-            column_types = {col: str(dtype) for col, dtype in df_processed.dtypes.items()}
+            column_types = dtype_names(df_processed)
             
             result = SchemaValidationResult(
                 file_path=str(file_path),
@@ -380,7 +382,7 @@ class Phase3SchemaService:
             df = pd.read_parquet(file_path)
             
             # Basic schema info
-            column_types = {col: str(dtype) for col, dtype in df.dtypes.items()}
+            column_types = dtype_names(df)
             schema_violations = self._count_schema_violations(df)
             total_cells = len(df) * len(df.columns)
             violation_rate = schema_violations / total_cells if total_cells > 0 else 0
@@ -427,7 +429,7 @@ class Phase3SchemaService:
                         "columns": len(df.columns),
                         "size_mb": round(file_size_mb, 2),
                         "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-                        "schema": {col: str(dtype) for col, dtype in df.dtypes.items()}
+                        "schema": dtype_names(df)
                     }
                     processed_files.append(file_info)
                     
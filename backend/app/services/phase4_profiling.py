@@ -1,7 +1,6 @@
 from typing import Dict, List
 import pandas as pd
 import numpy as np
-from scipy import stats
 from pydantic import BaseModel
 import json
 from pathlib import Path
@@ -85,6 +84,8 @@ class ProfilingService:
     
     def _profile_numeric(self, cols) -> Dict:
         """Profile numeric columns"""
+        from scipy import stats
+
         if len(cols) == 0:
             return {}
         
@@ -1,10 +1,6 @@
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
-from scipy import stats
-from sklearn.impute import KNNImputer
-from sklearn.experimental import enable_iterative_imputer  # noqa: F401
-from sklearn.impute import IterativeImputer
 from pydantic import BaseModel
 
 
@@ -196,6 +192,8 @@ class MissingDataService:
     
     def _apply_knn(self, df: pd.DataFrame, col: str) -> pd.DataFrame:
         """Apply KNN imputation"""
+        from sklearn.impute import KNNImputer
+
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         if col not in numeric_cols:
@@ -209,6 +207,9 @@ class MissingDataService:
     
     def _apply_mice(self, df: pd.DataFrame, col: str) -> pd.DataFrame:
         """Apply MICE imputation"""
+        from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+        from sklearn.impute import IterativeImputer
+
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         if col not in numeric_cols:
@@ -221,6 +222,8 @@ class MissingDataService:
     
     def _validate_imputation(self) -> Dict[str, ValidationMetrics]:
         """Validate imputation quality with PSI and KS tests"""
+        from scipy import stats
+
         validation: Dict[str, ValidationMetrics] = {}
         
         numeric_cols = self.df.select_dtypes(include=[np.number]).columns
@@ -1,8 +1,6 @@
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, RobustScaler
-from category_encoders import TargetEncoder
 from pydantic import BaseModel
 import joblib
 
@@ -116,6 +114,8 @@ class EncodingScalingService:
     
     def _apply_target_encoding(self, col: str, cardinality: int):
         """Apply Target Encoding with K-Fold (fit on TRAIN only)"""
+        from category_encoders import TargetEncoder
+
         if not self.target_col or self.target_col not in self.df_train.columns:
             # Fallback to ordinal
             self._apply_ordinal_encoding(col, cardinality)
@@ -160,6 +160,8 @@ class EncodingScalingService:
     
     def _scale_numeric(self) -> ScalingConfig:
         """Scale numeric features (fit on TRAIN only)"""
+        from sklearn.preprocessing import StandardScaler, RobustScaler
+
         numeric_cols = self.df_train.select_dtypes(include=[np.number]).columns
         
         # Remove target if numeric
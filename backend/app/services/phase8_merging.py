@@ -3,6 +3,8 @@ import pandas as pd
 from pydantic import BaseModel
 from pathlib import Path
 
+from ..utils.parquet_io import PARQUET_WRITE_KWARGS
+
 
 class MergingIssue(BaseModel):
     table: str
@@ -161,7 +163,7 @@ class MergingService:
         """Save orphaned records"""
         for table_name, df_orphans in self.orphans.items():
             path = artifacts_dir / f"orphans_{table_name}.parquet"
-            df_orphans.to_parquet(path, compression='zstd')
+            df_orphans.to_parquet(path, **PARQUET_WRITE_KWARGS)
 
     def _unpack_table(self, table_info: Dict[str, object]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
         if isinstance(table_info, pd.DataFrame):
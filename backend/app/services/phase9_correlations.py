@@ -1,8 +1,9 @@
+from pathlib import Path
 from typing import List
 import pandas as pd
 import numpy as np
-from scipy import stats
-from scipy.stats import chi2_contingency
+import pyarrow as pa
+import pyarrow.feather as feather
 from pydantic import BaseModel
 import warnings
 
@@ -25,6 +26,31 @@ class CorrelationsResult(BaseModel):
     total_tests: int
 
 
+CORRELATION_PAIRS_SCHEMA = pa.schema([
+    ("feature1", pa.string()),
+    ("feature2", pa.string()),
+    ("correlation", pa.float64()),
+    ("p_value", pa.float64()),
+    ("method", pa.string()),
+    ("n", pa.int64()),
+])
+
+
+def write_correlation_pairs(result: CorrelationsResult, path: Path) -> None:
+    """Persist numeric then categorical pairs as an uncompressed Feather table"""
+    pairs = result.numeric_correlations + result.categorical_associations
+    table = pa.Table.from_pylist(
+        [pair.model_dump() for pair in pairs], schema=CORRELATION_PAIRS_SCHEMA
+    )
+    # Uncompressed so later phases can memory-map the file instead of decoding it
+    feather.write_feather(table, path, compression="uncompressed")
+
+
+def read_correlation_pairs(path: Path) -> List[dict]:
+    """Load pairs written by ``write_correlation_pairs`` as plain dicts"""
+    return feather.read_table(path, memory_map=True).to_pylist()
+
+
 class CorrelationsService:
     def __init__(self, df: pd.DataFrame):
         self.df = df
@@ -87,6 +113,8 @@ class CorrelationsService:
     
     def _safe_numeric_correlations(self) -> List[CorrelationPair]:
         """Calculate numeric correlations with robust error handling"""
+        from scipy import stats
+
         try:
             # Get numeric columns, excluding boolean types
             numeric_cols = self.df.select_dtypes(include=[np.number]).columns
@@ -133,6 +161,8 @@ class CorrelationsService:
     
     def _safe_categorical_associations(self) -> List[CorrelationPair]:
         """Calculate categorical associations with robust error handling"""
+        from scipy.stats import chi2_contingency
+
         try:
             # Get categorical columns
             cat_cols = self.df.select_dtypes(include=['object', 'category']).columns
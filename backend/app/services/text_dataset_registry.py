@@ -6,6 +6,8 @@ from typing import Dict, Optional
 
 import pandas as pd
 
+from ..utils.parquet_io import PARQUET_WRITE_KWARGS
+
 
 class TextDatasetRegistry:
     """
@@ -22,7 +24,7 @@ class TextDatasetRegistry:
     def register(self, name: str, key_column: str, df: pd.DataFrame) -> Dict[str, str]:
         slug = _slugify(name)
         file_path = self.base_dir / f"{slug}.parquet"
-        df.to_parquet(file_path, compression="zstd")
+        df.to_parquet(file_path, **PARQUET_WRITE_KWARGS)
 
         self._registry[slug] = {
             "name": name,
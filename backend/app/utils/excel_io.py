@@ -0,0 +1,20 @@
+"""
+Excel I/O helpers - Mind-Q V3
+Workbook reads for uploads and ingestion
+"""
+
+import pandas as pd
+
+
+def read_excel(source, **kwargs) -> pd.DataFrame:
+    """
+    ``pd.read_excel`` using the Rust calamine parser, with pandas' default
+    engine (openpyxl for .xlsx, xlrd for .xls) as fallback when calamine is
+    not installed or cannot parse the workbook.
+    """
+    try:
+        return pd.read_excel(source, engine="calamine", **kwargs)
+    except Exception:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return pd.read_excel(source, **kwargs)
@@ -0,0 +1,18 @@
+"""
+DataFrame info helpers - Mind-Q V3
+Column metadata for API responses and phase results
+"""
+
+from typing import Dict
+
+import pandas as pd
+
+
+def dtype_names(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    ``{column: str(dtype)}``, equal to ``df.dtypes.astype(str).to_dict()``
+    but formatting each distinct dtype once rather than once per column.
+    """
+    dtypes = df.dtypes
+    names = {dtype: str(dtype) for dtype in set(dtypes.values)}
+    return dict(zip(dtypes.index, map(names.__getitem__, dtypes.values)))
@@ -4,12 +4,14 @@ Integration tests for Phase 1, 2, and 3 API endpoints
 
 import pytest
 import pandas as pd
+import json
 import tempfile
 import os
 from fastapi.testclient import TestClient
 from unittest.mock import patch
 
 from app.main import app
+from app.config import settings
 
 
 class TestPhaseAPIIntegration:
@@ -146,11 +148,11 @@ class TestPhaseAPIIntegration:
         assert data["data"]["columns_ingested"] == 7
         assert data["data"]["target_file"].endswith('.parquet')
     
-    def test_ingest_simple_endpoint(self, client, sample_csv_file):
+    def test_ingest_simple_endpoint(self, client, sample_csv_file, tmp_path):
         """Test simple ingestion endpoint"""
         response = client.post(
             "/api/v1/phases/ingest-simple",
-            json={"file_path": sample_csv_file}
+            params={"file_path": sample_csv_file, "artifacts_dir": str(tmp_path)}
         )
         
         assert response.status_code == 200
@@ -162,7 +164,15 @@ class TestPhaseAPIIntegration:
         df_info = data["dataframe_info"]
         assert df_info["shape"] == [5, 7]
         assert len(df_info["columns"]) == 7
-        assert len(df_info["dtypes"]) == 7
+        assert df_info["dtypes"] == {
+            "shipment_id": "int64",
+            "order_id": "int64",
+            "carrier": "object",
+            "origin": "object",
+            "destination": "object",
+            "pickup_date": "object",
+            "status": "object",
+        }
         
         # Check ingestion result
         result = data["ingestion_result"]
@@ -192,7 +202,27 @@ class TestPhaseAPIIntegration:
         data = response.json()
         assert data["status"] == "success"
         assert data["data"]["compression_ratio"] > 0
-    
+
+    def test_phase2_ingestion_endpoint(self, client, sample_csv_data, tmp_path, monkeypatch):
+        """Test Phase 2 copies cleaned data to ingested data unchanged"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        cleaned = sample_csv_data.set_index(
+            pd.Index([f"row_{i}" for i in range(len(sample_csv_data))], name="row_key")
+        )
+        cleaned.to_parquet(tmp_path / "cleaned_data.parquet")
+
+        response = client.post("/api/v1/phases/phase2-ingestion")
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["rows"] == 5
+        assert result["columns"] == 8  # index is stored as a column
+        assert result["column_names"] == list(sample_csv_data.columns) + ["row_key"]
+        assert result["source_file"] == "cleaned_data.parquet"
+
+        ingested = pd.read_parquet(tmp_path / "ingested_data.parquet")
+        pd.testing.assert_frame_equal(ingested, cleaned)
+
     def test_schema_validation_endpoint(self, client, sample_csv_file):
         """Test schema validation endpoint"""
         # First ingest the file
@@ -428,7 +458,66 @@ class TestWorkflowEndpoints:
             assert data["file_info"]["columns"] == 5
         
         os.unlink(f.name)
+
+    def test_workflow_sniffs_excel_upload_without_extension(self, client, sample_csv_data, tmp_path):
+        """Test an Excel upload is recognised by its signature, not its name"""
+        xlsx_path = tmp_path / "shipments.xlsx"
+        sample_csv_data.to_excel(xlsx_path, index=False)
+
+        response = client.post(
+            "/api/v1/phases/workflow/domain-check",
+            files={"file": ("shipments", xlsx_path.read_bytes(), "application/octet-stream")},
+            data={"domain": "logistics"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["file_info"]["rows"] == 5
+
+    def test_workflow_rejects_oversized_upload(self, client, sample_csv_data, monkeypatch):
+        """Test uploads above max_file_size_mb are rejected before parsing"""
+        monkeypatch.setattr(settings, "max_file_size_mb", 0)
+        
+        response = client.post(
+            "/api/v1/phases/workflow/domain-check",
+            files={"file": ("test.csv", sample_csv_data.to_csv(index=False).encode(), "text/csv")},
+        )
+        
+        assert response.status_code == 413
+        assert "upload limit" in response.json()["detail"]
     
+    def test_workflow_removes_spooled_upload_on_error(self, client, sample_csv_data, tmp_path, monkeypatch):
+        """Test the spooled temp file is deleted when a later step fails"""
+        monkeypatch.setattr(settings, "upload_tmp_dir", tmp_path)
+        
+        with patch(
+            "app.services.phase1_goal_kpis.Phase1Service.check_domain_compatibility",
+            side_effect=RuntimeError("compatibility check failed"),
+        ):
+            response = client.post(
+                "/api/v1/phases/workflow/full-pipeline",
+                files={"file": ("test.csv", sample_csv_data.to_csv(index=False).encode(), "text/csv")},
+            )
+        
+        assert response.status_code == 500
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_workflow_full_pipeline_stream(self, client, sample_csv_data, tmp_path, monkeypatch):
+        """Test the streamed pipeline emits one NDJSON line per step and cleans up"""
+        monkeypatch.setattr(settings, "upload_tmp_dir", tmp_path)
+
+        response = client.post(
+            "/api/v1/phases/workflow/full-pipeline/stream",
+            files={"file": ("test.csv", sample_csv_data.to_csv(index=False).encode(), "text/csv")},
+            params={"domain": "logistics"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["file_info"]["columns"] == list(sample_csv_data.columns)
+        assert lines[1]["step"] == "domain_compatibility"
+        assert list(tmp_path.iterdir()) == []
+
     def test_workflow_unsupported_file_format(self, client):
         """Test workflow with unsupported file format"""
         with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
@@ -520,7 +609,17 @@ class TestAPIStatus:
         assert "total_phases" in data
         assert data["phases_implemented"] >= 4  # Should include phases 0, 1, 2, 3
         assert data["total_phases"] == 14
-    
+
+    def test_routes_default_to_orjson(self):
+        """Test every router inherits the app-wide ORJSONResponse default"""
+        from fastapi.responses import ORJSONResponse
+        from fastapi.routing import APIRoute
+
+        routes = [route for route in app.routes if isinstance(route, APIRoute)]
+
+        assert routes
+        assert all(route.response_class is ORJSONResponse for route in routes)
+
     def test_phase1_status_endpoint(self, client):
         """Test Phase 1 status endpoint"""
         response = client.get("/api/v1/phases/status")
@@ -531,3 +630,210 @@ class TestAPIStatus:
         assert data["name"] == "Goal & KPIs Definition"
         assert "progress" in data
         assert "validation" in data
+    
+    def test_phase_services_are_shared_across_requests(self, client):
+        """Test the phase service factories hand out one instance per process"""
+        from app.api.v1 import phases
+        
+        client.get("/api/v1/phases/domains")
+        client.get("/api/v1/phases/domains")
+        
+        assert phases.get_phase1_service.cache_info().misses <= 1
+        assert phases.get_phase1_service() is phases.get_phase1_service()
+        assert phases.get_phase2_service() is phases.get_phase2_service()
+        assert phases.get_phase3_service() is phases.get_phase3_service()
+    
+    def test_ingest_concurrency_is_bounded(self, monkeypatch):
+        """Test concurrent ingest requests never exceed INGEST_CONCURRENCY workers"""
+        import asyncio
+        import threading
+        import time
+        from app.api.v1 import phases
+        
+        lock = threading.Lock()
+        active = peak = 0
+        
+        def fake_ingest(source_file, config=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+        
+        monkeypatch.setattr(phases.get_phase2_service(), "ingest_data", fake_ingest)
+        monkeypatch.setattr(phases, "_INGEST_SEM", asyncio.Semaphore(2))
+        
+        async def burst():
+            await asyncio.gather(*(phases.ingest_data("unused.csv") for _ in range(6)))
+        
+        asyncio.run(burst())
+        
+        assert peak == 2
+    
+    def test_spool_dir_falls_back_when_unavailable(self, tmp_path, monkeypatch):
+        """Test uploads spool to the system temp dir when upload_tmp_dir cannot be used"""
+        from app.api.v1 import phases
+        
+        monkeypatch.setattr(settings, "upload_tmp_dir", tmp_path)
+        assert phases._spool_dir(1) == str(tmp_path)
+        assert phases._spool_dir(1 << 62) is None
+        
+        monkeypatch.setattr(settings, "upload_tmp_dir", tmp_path / "missing")
+        assert phases._spool_dir(1) is None
+    
+    def test_columns_endpoint_picks_best_keyword_match(self, client, tmp_path, monkeypatch):
+        """Test /columns scores candidate artifacts by column names and reads the winner"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        pd.DataFrame({"a": [1, 2], "b": [3, 4]}).to_parquet(tmp_path / "merged_data.parquet")
+        pd.DataFrame({
+            "awb": ["x1", "x2", "x3"],
+            "delivered": [0, 1, 1],
+        }).to_parquet(tmp_path / "cleaned_data.parquet")
+        
+        with patch(
+            "app.api.v1.phases.TargetSuggester.suggest",
+            return_value={"suggested_target": None, "candidates": []},
+        ):
+            response = client.get("/api/v1/phases/columns", params={"domain": "logistics"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["name"] for c in data["columns"]] == ["awb", "delivered"]
+        assert data["suggested_target"] == "delivered"
+    
+    def test_phase14_infers_first_binary_target(self, client, tmp_path, monkeypatch):
+        """Test Phase 14 picks the first non-identifier binary column as target"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        pd.DataFrame({
+            "customer_id": [1, 2, 3, 4],
+            "amount": [10.0, 12.5, 9.0, 11.0],
+            "churned": [0, 1, 0, None],
+            "returned": [1, 0, 1, 0],
+        }).to_parquet(tmp_path / "train.parquet")
+        
+        response = client.post("/api/v1/phases/phase14-train-models", data={"domain": "retail"})
+        
+        assert response.status_code == 200
+        assert response.json()["target_column"] == "churned"
+        selected = json.loads((tmp_path / "selected_features.json").read_text())
+        assert selected["n_features_original"] == 4
+        assert selected["selected"] == ["customer_id", "amount", "returned"]
+    
+    def test_phase14_rejects_unique_fallback_target(self, client, tmp_path, monkeypatch):
+        """Test Phase 14 refuses to infer a target when the fallback column is unique per row"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        pd.DataFrame({"amount": [10.0, 12.5, 9.0]}).to_parquet(tmp_path / "merged_data.parquet")
+        
+        response = client.post("/api/v1/phases/phase14-train-models", data={"domain": "retail"})
+        
+        assert response.status_code == 400
+    
+    def test_columns_endpoint_skips_unhashable_columns(self, client, tmp_path, monkeypatch):
+        """Test /columns still reports hashable columns when one holds lists"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        pd.DataFrame({
+            "delivered": [0, 1, 1],
+            "tags": [["a"], ["b", "c"], []],
+            "origin": ["RUH", "JED", "RUH"],
+        }).to_parquet(tmp_path / "merged_data.parquet")
+        
+        with patch(
+            "app.api.v1.phases.TargetSuggester.suggest",
+            return_value={"suggested_target": None, "candidates": []},
+        ):
+            response = client.get("/api/v1/phases/columns", params={"domain": "logistics"})
+        
+        assert response.status_code == 200
+        assert {c["name"]: c["nunique"] for c in response.json()["columns"]} == {"delivered": 2, "origin": 2}
+
+    def test_sample_nunique_matches_pandas(self):
+        """Test the Arrow distinct counts used by /columns agree with pandas nunique"""
+        from app.api.v1.phases import _sample_nunique
+
+        df = pd.DataFrame({
+            "amount": [1.0, None, 2.0, 1.0],
+            "carrier": ["UPS", None, "DHL", "UPS"],
+            "segment": pd.Categorical(["a", "b", None, "a"]),
+            "returned": [True, False, None, True],
+            "shipped_at": pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-01"]),
+            "notes": [None] * 4,
+            "mixed": ["a", 1, None, "a"],
+        })
+
+        assert _sample_nunique(df) == df.nunique(dropna=True).to_dict()
+
+    def test_domain_catalog_responses_match_service(self, client):
+        """Test the pre-encoded /domains bodies match the Phase 1 domain catalog"""
+        from app.api.v1 import phases
+        from app.models.schemas import DomainType
+        
+        service = phases.get_phase1_service()
+        
+        response = client.get("/api/v1/phases/domains")
+        assert response.status_code == 200
+        assert response.json() == [d.model_dump(mode="json") for d in service.get_available_domains()]
+        
+        response = client.get("/api/v1/phases/domains/retail")
+        assert response.status_code == 200
+        assert response.json() == service.get_domain_info(DomainType.RETAIL).model_dump(mode="json")
+    
+    def test_load_json_reparses_only_after_change(self, tmp_path):
+        """Test JSON artifacts are served from cache until the file is rewritten"""
+        from app.api.v1 import phases
+        
+        path = tmp_path / "feature_dictionary.json"
+        path.write_text('[{"name": "status"}]')
+        first = phases._load_json(path)
+        assert phases._load_json(path) is first
+        
+        path.write_text('[{"name": "status"}, {"name": "origin"}]')
+        
+        assert [entry["name"] for entry in phases._load_json(path)] == ["status", "origin"]
+    
+    def test_quality_control_recovers_ragged_csv(self, client, tmp_path, monkeypatch):
+        """Test quality control falls back to the recovery parsers for malformed CSV"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        
+        response = client.post(
+            "/api/v1/phases/quality-control",
+            files={"file": ("orders.csv", b"order_id,status\n1,ok\n2,late,extra\n3,ok\n", "text/csv")},
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["status"] in ("PASS", "WARN")
+        assert pd.read_parquet(tmp_path / "cleaned_data.parquet")["order_id"].tolist() == [1, 3]
+    
+    @pytest.mark.parametrize("filename, to_bytes", [
+        ("reviews.csv", lambda df: df.to_csv(index=False).encode()),
+        ("reviews.parquet", lambda df: df.to_parquet()),
+    ])
+    def test_register_text_table_parses_upload_stream(self, client, tmp_path, monkeypatch, filename, to_bytes):
+        """Test text tables are registered straight from the uploaded file object"""
+        monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+        df = pd.DataFrame({"order_id": [1, 2, 3], "review": ["fast", "late", "damaged"]})
+        
+        response = client.post(
+            "/api/v1/phases/phase8/register-text-table",
+            files={"file": (filename, to_bytes(df))},
+            data={"dataset_name": "Reviews", "key_column": "order_id"},
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["dataset"]["row_count"] == 3
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "text_datasets" / "reviews.parquet"), df)
+    
+    def test_model_response_matches_response_model_encoding(self):
+        """Test phase results encode as FastAPI's response_model path would, with NaN as null"""
+        from typing import Any, Dict
+        from pydantic import BaseModel
+        from app.api.v1.responses import model_response
+        
+        class Result(BaseModel):
+            score: float
+            stats: Dict[str, Any]
+        
+        response = model_response(Result(score=float("nan"), stats={"mean": float("nan"), "n": 3}))
+        
+        assert json.loads(response.body) == {"score": None, "stats": {"mean": None, "n": 3}}
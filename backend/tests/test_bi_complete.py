@@ -141,6 +141,30 @@ def test_chart_explainer_guardrails():
     assert '2024-Q1' in result['summary']
 
 
+def test_chart_explainer_reuses_explanation_for_same_chart():
+    """Test an unchanged chart is explained once and callers get their own copy"""
+    signals = {
+        'meta': {'domain': 'logistics', 'time_window': '2024-Q2', 'n': 500},
+        'kpis': {},
+    }
+    chart = {'type': 'line', 'meta': {'metric': 'sla_pct'}}
+    llm_mock = Mock(return_value=json.dumps({
+        'summary': 'SLA trend for n=500 in 2024-Q2',
+        'findings': ['Stable'],
+        'recommendation': 'Keep monitoring'
+    }))
+
+    first = explain_chart(signals, chart, 'en', llm_mock)
+    first['findings'].append('edited by caller')
+    second = explain_chart(signals, chart, 'en', llm_mock)
+
+    assert llm_mock.call_count == 1
+    assert second['findings'] == ['Stable']
+
+    explain_chart(signals, chart, 'ar', llm_mock)
+    assert llm_mock.call_count == 2
+
+
 def test_chart_explainer_rejects_causal():
     """Test guardrails reject causal language"""
     signals = {
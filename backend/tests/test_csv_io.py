@@ -0,0 +1,40 @@
+"""
+Tests for CSV read helper
+"""
+
+import io
+
+import pyarrow as pa
+import pandas as pd
+import pytest
+
+from app.utils.csv_io import read_csv_arrow
+
+
+CSV_BYTES = (
+    b"order_id,order_date,shipped_at,carrier,weight,fragile\n"
+    b"1,2020-01-15,2020-01-15T10:00:00,UPS,1.5,true\n"
+    b"2,2019-03-20,2020-01-16 11:00:00,,,false\n"
+    b"3,,,DHL,2,\n"
+)
+
+
+def test_read_csv_arrow_matches_c_engine():
+    result = read_csv_arrow(io.BytesIO(CSV_BYTES))
+    expected = pd.read_csv(io.BytesIO(CSV_BYTES))
+
+    assert result.dtypes.to_dict() == expected.dtypes.to_dict()
+    pd.testing.assert_frame_equal(result.isna(), expected.isna())
+    pd.testing.assert_frame_equal(result.fillna(""), expected.fillna(""))
+
+
+def test_read_csv_arrow_keeps_date_text_verbatim():
+    result = read_csv_arrow(io.BytesIO(CSV_BYTES))
+
+    assert result["shipped_at"].iloc[0] == "2020-01-15T10:00:00"
+    assert result["order_date"].iloc[1] == "2019-03-20"
+
+
+def test_read_csv_arrow_rejects_ragged_rows():
+    with pytest.raises(pa.ArrowInvalid):
+        read_csv_arrow(io.BytesIO(b"a,b\n1,2\n3,4,5\n"))
@@ -0,0 +1,34 @@
+"""
+Tests for Excel read helper
+"""
+
+import io
+
+import pandas as pd
+
+from app.utils.excel_io import read_excel
+
+
+def test_read_excel_matches_openpyxl():
+    df = pd.DataFrame({
+        "patient_id": [1, 2, 3],
+        "department": ["Cardiology", None, "Neurology"],
+        "admission_ts": pd.to_datetime(["2020-01-15", "2019-03-20", "2021-06-10"]),
+        "charge": [120.5, None, 80.0],
+    })
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+
+    result = read_excel(io.BytesIO(buffer.getvalue()))
+
+    pd.testing.assert_frame_equal(
+        result, pd.read_excel(io.BytesIO(buffer.getvalue()), engine="openpyxl")
+    )
+
+
+def test_read_excel_header_only():
+    buffer = io.BytesIO()
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}).to_excel(buffer, index=False)
+    buffer.seek(0)
+
+    assert read_excel(buffer, nrows=0).columns.tolist() == ["a", "b"]
@@ -0,0 +1,22 @@
+"""
+Tests for DataFrame info helpers
+"""
+
+import pandas as pd
+
+from app.utils.frame_info import dtype_names
+
+
+def test_dtype_names_match_pandas():
+    df = pd.DataFrame({
+        "order_id": [1, 2],
+        "weight": [1.5, None],
+        "carrier": ["UPS", "DHL"],
+        "segment": pd.Categorical(["a", "b"]),
+        "shipped_at": pd.to_datetime(["2020-01-01", None]).tz_localize("UTC"),
+        "fragile": [True, False],
+        "note": pd.array(["x", None], dtype="string"),
+    })
+
+    assert dtype_names(df) == df.dtypes.astype(str).to_dict()
+    assert dtype_names(df.iloc[:, :0]) == {}
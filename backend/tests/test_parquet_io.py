@@ -0,0 +1,110 @@
+"""
+Tests for shared Parquet write settings
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from app.utils.parquet_io import (
+    PARQUET_WRITE_KWARGS, parquet_columns, parquet_distinct_counts, parquet_num_rows,
+    read_parquet_async, read_parquet_cached, read_parquet_head,
+)
+
+
+def test_parquet_write_kwargs_use_zstd(tmp_path):
+    df = pd.DataFrame({
+        "status": ["delivered", "returned", "delivered", "pending"] * 25,
+        "amount": range(100),
+    })
+    path = tmp_path / "artifact.parquet"
+
+    df.to_parquet(path, **PARQUET_WRITE_KWARGS)
+
+    metadata = pq.ParquetFile(path).metadata
+    for rg in range(metadata.num_row_groups):
+        for col in range(metadata.num_columns):
+            assert metadata.row_group(rg).column(col).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+
+def test_read_parquet_async_matches_sync_read(tmp_path):
+    df = pd.DataFrame({"city": ["Riyadh", "Jeddah", "Dammam"], "orders": [10, 20, 30]})
+    path = tmp_path / "artifact.parquet"
+    df.to_parquet(path, **PARQUET_WRITE_KWARGS)
+
+    result = asyncio.run(read_parquet_async(path, columns=["orders"]))
+
+    pd.testing.assert_frame_equal(result, df[["orders"]])
+
+
+def test_read_parquet_cached_hands_out_independent_copies(tmp_path):
+    path = tmp_path / "artifact.parquet"
+    pd.DataFrame({"city": ["Riyadh", "Jeddah"], "orders": [10, 20]}).to_parquet(path)
+
+    first = read_parquet_cached(path)
+    first.loc[0, "orders"] = -1
+    first["city"] = first["city"].str.upper()
+
+    pd.testing.assert_frame_equal(read_parquet_cached(path), pd.read_parquet(path))
+
+
+def test_read_parquet_cached_refreshes_when_file_changes(tmp_path):
+    path = tmp_path / "artifact.parquet"
+    pd.DataFrame({"a": [1]}).to_parquet(path)
+    assert read_parquet_cached(path)["a"].tolist() == [1]
+
+    pd.DataFrame({"a": [1, 2, 3]}).to_parquet(path)
+
+    assert read_parquet_cached(path)["a"].tolist() == [1, 2, 3]
+
+
+def test_parquet_columns_match_read_parquet(tmp_path):
+    df = pd.DataFrame({"order_id": [1, 2], "status": ["ok", "late"]}).set_index("order_id")
+    path = tmp_path / "artifact.parquet"
+    df.to_parquet(path)
+
+    assert parquet_columns(path) == pd.read_parquet(path).columns.tolist() == ["status"]
+
+
+def test_parquet_columns_refresh_when_file_changes(tmp_path):
+    path = tmp_path / "artifact.parquet"
+    pd.DataFrame({"a": [1]}).to_parquet(path)
+    assert parquet_columns(path) == ["a"]
+
+    pd.DataFrame({"a": [1, 2], "b": [3, 4]}).to_parquet(path)
+
+    assert parquet_columns(path) == ["a", "b"]
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 2_999, 3_000, 10_000, 50_000])
+def test_read_parquet_head_matches_full_read(tmp_path, n_rows):
+    df = pd.DataFrame({"order": range(20_000), "city": ["Riyadh", "Jeddah"] * 10_000}).iloc[5:]
+    path = tmp_path / "artifact.parquet"
+    df.to_parquet(path, row_group_size=3_000)
+
+    pd.testing.assert_frame_equal(read_parquet_head(path, n_rows), pd.read_parquet(path).head(n_rows))
+
+
+def test_parquet_distinct_counts_match_pandas_nunique(tmp_path):
+    df = pd.DataFrame({
+        "amount": [1.0, np.nan, 2.0, 1.0],
+        "carrier": ["UPS", None, "DHL", "UPS"],
+        "segment": pd.Categorical(["a", "b", None, "a"], categories=["a", "b", "c"]),
+        "returned": [True, False, None, True],
+        "order_id": [1, 2, 3, 4],
+        "shipped_at": pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-01"]),
+        "notes": [None] * 4,
+    })
+    path = tmp_path / "artifact.parquet"
+    df.to_parquet(path)
+    stored = pd.read_parquet(path)
+
+    assert parquet_num_rows(path) == 4
+    for column in df.columns:
+        assert parquet_distinct_counts(path, column) == (
+            stored[column].nunique(), stored[column].nunique(dropna=False)
+        ), column
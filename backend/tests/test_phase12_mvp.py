@@ -2,12 +2,16 @@
 Unit tests for Phase 12: Text Features (enhanced MVP)
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import pytest
 from pathlib import Path
 
-from app.services.phase12.detection import TextDetectionService
+from app.api.v1.phases import run_phase12
+from app.config import settings
+from app.services.phase12.detection import TextDetectionService, is_text_arrow_type
 from app.services.phase12.text_cleaning import TextCleaningService
 from app.services.phase12.basic_features import BasicTextFeaturesService
 from app.services.phase12.keyword_extractor import KeywordExtractionService
@@ -33,6 +37,52 @@ def test_text_detection_identifies_descriptive_fields():
     assert result.language_detected in {"en", "mixed", "unknown"}
 
 
+def test_text_detection_handles_arrow_backed_strings():
+    df = pd.DataFrame({
+        "order_id": range(8),
+        "customer_note": [
+            "Customer praised fast delivery and packaging details",
+            "Delivery delay resolved quickly with an apology",
+        ] * 4,
+    }).convert_dtypes(dtype_backend="pyarrow")
+
+    result = TextDetectionService(df=df).run()
+
+    assert result.text_columns == ["customer_note"]
+
+
+def test_text_detection_skips_nested_arrow_string_types():
+    notes = [
+        ["Customer praised fast delivery", "and packaging details"],
+        ["Delivery delay resolved quickly", "with an apology"],
+    ] * 4
+    df = pd.DataFrame({
+        "note_parts": pd.Series(notes, dtype=pd.ArrowDtype(pa.list_(pa.string()))),
+        "note_struct": pd.Series(
+            [{"text": " ".join(parts)} for parts in notes],
+            dtype=pd.ArrowDtype(pa.struct([("text", pa.string())])),
+        ),
+    })
+
+    result = TextDetectionService(df=df).run()
+
+    assert result.text_columns == []
+
+
+@pytest.mark.parametrize(
+    ("arrow_type", "expected"),
+    [
+        (pa.string(), True),
+        (pa.large_string(), True),
+        (pa.dictionary(pa.int32(), pa.string()), True),
+        (pa.int64(), False),
+        (pa.float64(), False),
+    ],
+)
+def test_is_text_arrow_type(arrow_type, expected):
+    assert is_text_arrow_type(arrow_type) is expected
+
+
 def test_text_detection_skips_numeric_fields():
     codes = np.random.choice(["A12", "B33", "Z99", "X10"], size=50)
     df = pd.DataFrame({
@@ -150,6 +200,28 @@ def test_phase12_orchestrator_completed(tmp_path: Path):
     assert "note" in result.sentiment
 
 
+def test_phase12_orchestrator_matches_on_arrow_backed_parquet(tmp_path: Path):
+    df = pd.DataFrame({
+        "note": [
+            "Customer appreciated proactive communication about delivery.",
+            "Delivery was late but customer support was helpful.",
+            None,
+            "Average experience overall with timely updates.",
+        ],
+        "amount": [10.5, None, 7.25, 3.0],
+    })
+    data_path = tmp_path / "merged_data.parquet"
+    df.to_parquet(data_path)
+
+    object_result = Phase12Orchestrator(df=pd.read_parquet(data_path)).run(tmp_path)
+    arrow_result = Phase12Orchestrator(
+        df=pd.read_parquet(data_path, dtype_backend="pyarrow")
+    ).run(tmp_path)
+
+    assert arrow_result.status == "completed"
+    assert arrow_result.model_dump() == object_result.model_dump()
+
+
 def test_phase12_orchestrator_partial_large_dataset(tmp_path: Path):
     df = pd.DataFrame({
         "note": ["Large dataset sample text"] * 600000,
@@ -164,5 +236,18 @@ def test_phase12_orchestrator_partial_large_dataset(tmp_path: Path):
     assert any("Text volume" in warn for warn in result.warnings)
 
 
+def test_phase12_endpoint_skips_numeric_only_parquet(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(settings, "artifacts_dir", tmp_path)
+    pd.DataFrame({
+        "id": range(10),
+        "amount": np.linspace(0.0, 1.0, 10),
+    }).to_parquet(tmp_path / "merged_data.parquet")
+
+    result = asyncio.run(run_phase12())
+
+    assert result.status == "skipped"
+    assert result.detection.text_columns == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
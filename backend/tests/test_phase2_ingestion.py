@@ -4,6 +4,7 @@ Tests for Phase 2: Data Ingestion Service
 
 import pytest
 import pandas as pd
+import pyarrow.parquet as pq
 import tempfile
 import os
 from pathlib import Path
@@ -212,6 +213,56 @@ class TestPhase2Chunking:
         assert len(df) == 1000
         assert len(df.columns) == 5
 
+        # One row group per CSV chunk
+        assert pq.ParquetFile(target_path).metadata.num_row_groups == 10
+    
+    def test_csv_chunk_dtype_drift_falls_back_to_full_read(self, service):
+        """Test a later chunk whose dtype differs from the first still ingests"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("id,amount\n")
+            f.writelines(f"{i},{i * 10}\n" for i in range(5))
+            f.writelines(f"{i},pending\n" for i in range(5, 10))
+        config = IngestionConfig(source_file=f.name, chunk_size=5)
+        
+        try:
+            result = service.ingest_data(f.name, config)
+        finally:
+            os.unlink(f.name)
+        
+        assert result.status == "success"
+        df = pd.read_parquet(result.data.target_file)
+        assert len(df) == 10
+        assert (df["amount"] == "pending").sum() == 5
+    
+    def test_csv_declared_dtypes_skip_inference(self, service, large_csv_file):
+        """Test declared dtypes are applied to every chunk"""
+        config = IngestionConfig(
+            source_file=large_csv_file, chunk_size=100, dtype={"id": "string", "salary": "float64"}
+        )
+        
+        result = service.ingest_data(large_csv_file, config)
+        
+        assert result.status == "success"
+        df = pd.read_parquet(result.data.target_file)
+        assert str(df["id"].dtype) == "string"
+        assert str(df["salary"].dtype) == "float64"
+    
+    def test_csv_declared_dtype_mismatch_falls_back_to_inference(self, service):
+        """Test a declared dtype that does not fit the values is dropped"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("id,amount\n")
+            f.writelines(f"{i},unknown\n" for i in range(5))
+        config = IngestionConfig(source_file=f.name, dtype={"amount": "float64"})
+        
+        try:
+            result = service.ingest_data(f.name, config)
+        finally:
+            os.unlink(f.name)
+        
+        assert result.status == "success"
+        df = pd.read_parquet(result.data.target_file)
+        assert (df["amount"] == "unknown").all()
+
 
 class TestPhase2Compression:
     """Test compression functionality"""
@@ -3,7 +3,11 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from app.services.phase8_merging import MergingService
-from app.services.phase9_correlations import CorrelationsService
+from app.services.phase9_correlations import (
+    CorrelationsService,
+    read_correlation_pairs,
+    write_correlation_pairs,
+)
 from app.services.phase9_5_business_validation import BusinessValidationService
 
 
@@ -60,6 +64,27 @@ def test_phase9_numeric_correlations():
     assert abs(corr_pair.correlation) > 0.6
 
 
+def test_phase9_correlation_pairs_roundtrip(tmp_path):
+    """Test Feather correlation artifact preserves every pair"""
+    np.random.seed(42)
+    df = pd.DataFrame({
+        'feature1': np.random.randn(50),
+        'feature2': np.random.randn(50),
+        'carrier': np.random.choice(['UPS', 'DHL'], 50),
+        'region': np.random.choice(['north', 'south'], 50),
+    })
+    result = CorrelationsService(df=df).run()
+    path = tmp_path / "correlation_pairs.feather"
+
+    write_correlation_pairs(result, path)
+
+    expected = [
+        pair.model_dump()
+        for pair in result.numeric_correlations + result.categorical_associations
+    ]
+    assert read_correlation_pairs(path) == expected
+
+
 def test_phase9_fdr_correction():
     """Test FDR correction when > 20 tests"""
     # Create dataset with many features
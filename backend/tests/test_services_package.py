@@ -0,0 +1,33 @@
+"""
+Tests for the app.services package exports
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import app.services as services
+
+
+def test_exports_resolve_to_defining_modules():
+    from app.services.domain_packs import suggest_domain
+    from app.services.phase2_ingestion import IngestionResult
+
+    assert services.IngestionResult is IngestionResult
+    assert services.suggest_domain is suggest_domain
+    assert set(services.__all__) <= set(dir(services))
+
+
+def test_unknown_export_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        services.NotAService
+
+
+def test_submodule_import_skips_other_phases():
+    code = (
+        "import sys, app.services.domain_packs; "
+        "print('app.services.phase1_goal_kpis' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"